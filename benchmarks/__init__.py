@@ -0,0 +1,10 @@
+"""Benchmarks of fbx_plum.
+
+Run all benchmarks and save the results with::
+
+    python -m benchmarks --output results.json
+
+and check a later run for regressions with::
+
+    python -m benchmarks --compare results.json
+"""
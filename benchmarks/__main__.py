@@ -0,0 +1,67 @@
+import argparse
+import fnmatch
+import sys
+
+from . import harness
+from .cases import cases
+
+parser = argparse.ArgumentParser(
+    prog="python -m benchmarks",
+    description="Run the benchmarks of fbx_plum.",
+)
+parser.add_argument(
+    "pattern",
+    nargs="*",
+    help="Only run benchmarks whose names match one of these glob patterns.",
+)
+parser.add_argument("-o", "--output", help="Save the results to this JSON file.")
+parser.add_argument(
+    "-c",
+    "--compare",
+    metavar="BASELINE",
+    help="Compare the results to the results in this JSON file. Exits with status 1 "
+    "if a benchmark regressed.",
+)
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="Relative slowdown above which a benchmark regressed. Defaults to 0.1.",
+)
+parser.add_argument(
+    "--repeat", type=int, default=7, help="Number of samples. Defaults to 7."
+)
+parser.add_argument(
+    "--min-time",
+    type=float,
+    default=10.0,
+    help="Minimum duration of a sample in milliseconds. Defaults to 10.",
+)
+parser.add_argument("--quick", action="store_true", help="Skip the slow benchmarks.")
+args = parser.parse_args()
+
+selected = [
+    case
+    for case in cases(quick=args.quick)
+    if not args.pattern or any(fnmatch.fnmatch(case.name, p) for p in args.pattern)
+]
+results = harness.run(
+    selected,
+    log=print,
+    repeat=args.repeat,
+    min_time=int(args.min_time * 1e6),
+)
+if args.output:
+    harness.save(results, args.output)
+
+if args.compare:
+    lines, regressions = harness.compare(
+        results,
+        harness.load(args.compare),
+        threshold=args.threshold,
+    )
+    print()
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed.")
+        sys.exit(1)
@@ -0,0 +1,200 @@
+import subprocess
+import sys
+from time import perf_counter_ns
+from typing import Iterator, List, Literal, Tuple
+
+from fbx_plum import (
+    Dispatcher,
+    Function,
+    Signature,
+    add_conversion_method,
+    add_promotion_rule,
+    convert,
+    parametric,
+    promote,
+)
+
+from .harness import Case
+
+__all__ = ["cases"]
+
+
+def native() -> Iterator[Case]:
+    """Calls without dispatch, for reference."""
+
+    def f(x):
+        pass
+
+    class A:
+        def go(self, x):
+            pass
+
+    yield Case("native/function", "f(1)", namespace={"f": f})
+    yield Case("native/method", "a.go(1)", namespace={"a": A()})
+
+
+def calls() -> Iterator[Case]:
+    """Calls which hit the cache."""
+    dispatch = Dispatcher()
+
+    for arity in range(1, 6):
+        g = Function(_method)
+        g.register(_method, signature=Signature(*(int,) * arity))
+        g.register(_method, signature=Signature(*(str,) * arity))
+        args = ", ".join(["1"] * arity)
+        yield Case(f"call/arity-{arity}", f"g({args})", namespace={"g": g})
+
+    class B:
+        @dispatch
+        def __call__(self, x: int):
+            pass
+
+        @dispatch
+        def __call__(self, x: str):
+            pass
+
+        @dispatch
+        def go(self, x: int):
+            pass
+
+        @dispatch
+        def go(self, x: str):
+            pass
+
+    yield Case("call/method", "b.go(1)", namespace={"b": B()})
+    yield Case("call/dunder-call", "b(1)", namespace={"b": B()})
+
+    @dispatch
+    def returns(x: int) -> int:
+        return x
+
+    @dispatch
+    def returns(x: str) -> str:
+        return x
+
+    yield Case("call/return-type", "returns(1)", namespace={"returns": returns})
+
+
+def unfaithful() -> Iterator[Case]:
+    """Calls with parametric types and types which are not faithful."""
+    dispatch = Dispatcher()
+
+    @parametric
+    class P:
+        def __init__(self, x):
+            self.x = x
+
+    @dispatch
+    def p(x: P[int]):
+        pass
+
+    @dispatch
+    def p(x: P[str]):
+        pass
+
+    yield Case("call/parametric", "p(x)", namespace={"p": p, "x": P(1)})
+
+    @dispatch
+    def t(x: Tuple[int]):
+        pass
+
+    @dispatch
+    def t(x: Tuple[str]):
+        pass
+
+    yield Case("call/parametric-hint", "t(x)", namespace={"t": t, "x": (1,)})
+
+    @dispatch
+    def lit(x: int):
+        pass
+
+    @dispatch
+    def lit(x: Literal[1]):
+        pass
+
+    namespace = {"lit": lit}
+    yield Case("call/unfaithful-match", "lit(1)", namespace=namespace)
+    yield Case("call/unfaithful-no-match", "lit(2)", namespace=namespace)
+
+
+def scaling(sizes: List[int]) -> Iterator[Case]:
+    """Registration and resolution of a method as the number of methods grows."""
+    for n in sizes:
+        base = type("Base", (), {})
+        classes = [type(f"C{i}", (base,), {}) for i in range(n)]
+        signatures = [Signature(c) for c in classes]
+        x = classes[n // 2]()
+
+        def register(signatures=signatures, x=x):
+            # Time until the first call returns, which includes building the index.
+            start = perf_counter_ns()
+            f = Function(_method)
+            for signature in signatures:
+                f.register(_method, signature=signature)
+            f(x)
+            return perf_counter_ns() - start
+
+        f = Function(_method)
+        for signature in signatures:
+            f.register(_method, signature=signature)
+        namespace = {"f": f, "x": x}
+        yield Case(f"register/{n}-methods", sample=register, repeat=3)
+        # Also clear the index of the resolver and the comparisons of signatures, so
+        # the method is resolved from scratch.
+        yield Case(
+            f"resolve/cold-{n}-methods",
+            "f(x)",
+            setup="f.clear_cache(reregister=False); f._resolver.clear_cache()",
+            namespace=namespace,
+            number=1,
+        )
+
+
+def promotion() -> Iterator[Case]:
+    """Promotion and conversion."""
+    add_promotion_rule(int, float, float)
+    add_conversion_method(int, float, float)
+    namespace = {"promote": promote, "convert": convert}
+    yield Case("promote/int-int", "promote(1, 1)", namespace=namespace)
+    yield Case("promote/int-float", "promote(1, 1.0)", namespace=namespace)
+    yield Case("promote/int-float-int", "promote(1, 1.0, 1)", namespace=namespace)
+    yield Case("convert/identity", "convert(1, int)", namespace=namespace)
+    yield Case("convert/int-to-float", "convert(1, float)", namespace=namespace)
+    yield Case("convert/int-to-tuple", "convert(1, tuple)", namespace=namespace)
+
+
+def importing() -> Iterator[Case]:
+    """Importing the package in a fresh interpreter."""
+
+    def sample():
+        code = (
+            "from time import perf_counter_ns\n"
+            "start = perf_counter_ns()\n"
+            "import fbx_plum\n"
+            "print(perf_counter_ns() - start)\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        return int(output)
+
+    yield Case("import/fbx_plum", sample=sample)
+
+
+def cases(quick: bool = False) -> Iterator[Case]:
+    """All benchmarks.
+
+    Args:
+        quick (bool, optional): Skip the slow benchmarks. Defaults to `False`.
+
+    Returns:
+        iterator[:class:`.harness.Case`]: Benchmarks.
+    """
+    yield from native()
+    yield from calls()
+    yield from unfaithful()
+    yield from scaling([10, 100] if quick else [10, 100, 1000, 10000])
+    yield from promotion()
+    yield from importing()
+
+
+def _method(*args):
+    pass
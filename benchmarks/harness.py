@@ -0,0 +1,201 @@
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from time import perf_counter_ns
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+__all__ = ["Case", "measure", "run", "save", "load", "compare"]
+
+
+class Case(NamedTuple):
+    """A benchmark.
+
+    Attributes:
+        name (str): Name of the benchmark.
+        stmt (str): Statement to time.
+        setup (str, optional): Statement which is run before every sample. Defaults
+            to doing nothing.
+        namespace (dict, optional): Namespace in which `stmt` and `setup` are run.
+        number (int, optional): Number of times `stmt` is run per sample. Defaults
+            to calibrating this such that a sample takes at least the minimum time.
+        sample (function, optional): Instead of timing `stmt`, call this function to
+            obtain a sample. It must return a duration in nanoseconds.
+        repeat (int, optional): Number of samples. Overrides the number of samples
+            given to :func:`.harness.measure`, e.g. for slow benchmarks.
+    """
+
+    name: str
+    stmt: str = "pass"
+    setup: str = "pass"
+    namespace: Optional[dict] = None
+    number: Optional[int] = None
+    sample: Optional[Callable[[], int]] = None
+    repeat: Optional[int] = None
+
+
+def _calibrate(timer: timeit.Timer, min_time: int) -> int:
+    """Find the number of runs such that a sample takes at least some time.
+
+    Args:
+        timer (:class:`timeit.Timer`): Timer.
+        min_time (int): Minimum duration of a sample in nanoseconds.
+
+    Returns:
+        int: Number of runs.
+    """
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            return number
+        number *= 2
+
+
+def measure(case: Case, repeat: int = 7, warmup: int = 1, min_time: int = 10**7):
+    """Run a benchmark.
+
+    Args:
+        case (:class:`.harness.Case`): Benchmark.
+        repeat (int, optional): Number of samples. Defaults to `7`.
+        warmup (int, optional): Number of samples to discard before measuring.
+            Defaults to `1`.
+        min_time (int, optional): Minimum duration of a sample in nanoseconds.
+            Defaults to ten milliseconds.
+
+    Returns:
+        dict: Statistics of the durations in nanoseconds of a single run of the
+            statement.
+    """
+    repeat = case.repeat or repeat
+    if case.sample is not None:
+        number = 1
+        for _ in range(warmup):
+            case.sample()
+        samples = [case.sample() for _ in range(repeat)]
+    else:
+        namespace = dict(case.namespace or {})
+        timer = timeit.Timer(case.stmt, case.setup, perf_counter_ns, namespace)
+        number = case.number or _calibrate(timer, min_time)
+        for _ in range(warmup):
+            timer.timeit(number)
+        samples = [timer.timeit(number) / number for _ in range(repeat)]
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run(
+    cases: Iterable[Case],
+    log: Optional[Callable[[str], None]] = None,
+    **kw_args,
+) -> dict:
+    """Run benchmarks.
+
+    Args:
+        cases (iterable[:class:`.harness.Case`]): Benchmarks.
+        log (function, optional): Called with a line of text after every benchmark.
+        **kw_args: Further keyword arguments are passed to :func:`.harness.measure`.
+
+    Returns:
+        dict: Results, which can be saved with :func:`.harness.save`.
+    """
+    from fbx_plum import __version__
+
+    results = {}
+    for case in cases:
+        results[case.name] = stats = measure(case, **kw_args)
+        if log:
+            log(
+                f"{case.name:<40} {_format(stats['min']):>10} (min) "
+                f"{_format(stats['median']):>10} (median)"
+            )
+    return {
+        "fbx_plum": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+
+
+def save(results: dict, path: str) -> None:
+    """Save results to a JSON file.
+
+    Args:
+        results (dict): Results returned by :func:`.harness.run`.
+        path (str): Path of the file.
+    """
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict:
+    """Load results from a JSON file.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        dict: Results.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    threshold: float = 0.1,
+    statistic: str = "min",
+) -> Tuple[List[str], List[str]]:
+    """Compare results against a baseline.
+
+    Args:
+        results (dict): Results.
+        baseline (dict): Results of the baseline.
+        threshold (float, optional): Relative slowdown above which a benchmark is
+            considered a regression. Defaults to `0.1`.
+        statistic (str, optional): Statistic to compare. Defaults to `"min"`, which
+            is least sensitive to noise.
+
+    Returns:
+        list[str]: Lines of a table which compares all benchmarks in both results.
+        list[str]: Names of the benchmarks which regressed.
+    """
+    lines = [f"{'benchmark':<40} {'baseline':>10} {'current':>10} {'change':>8}"]
+    regressions = []
+    for name, stats in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name][statistic]
+        after = stats[statistic]
+        change = after / before - 1
+        line = f"{name:<40} {_format(before):>10} {_format(after):>10} {change:>+8.1%}"
+        if change > threshold:
+            regressions.append(name)
+            line += "  REGRESSION"
+        lines.append(line)
+    return lines, regressions
+
+
+def _format(duration: float) -> str:
+    """Format a duration.
+
+    Args:
+        duration (float): Duration in nanoseconds.
+
+    Returns:
+        str: `duration` in a readable unit.
+    """
+    for unit, scale in [("s", 1e9), ("ms", 1e6), ("us", 1e3)]:
+        if duration >= scale:
+            return f"{duration / scale:.2f} {unit}"
+    return f"{duration:.1f} ns"
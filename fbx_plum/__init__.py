@@ -6,7 +6,6 @@ from typing import Dict, List, Tuple, Union  # noqa: F401
 
 from beartype import BeartypeConf as _BeartypeConf
 from beartype import BeartypeStrategy as _BeartypeStrategy
-from beartype.door import TypeHint as _TypeHint
 from beartype.door import is_bearable as _is_bearable
 
 from ._version import __version__  # noqa: F401
@@ -20,7 +19,7 @@ from .promotion import *  # noqa: F401, F403
 from .resolver import *  # noqa: F401, F403
 from .signature import *  # noqa: F401, F403
 from .type import *  # noqa: F401, F403
-from .type import resolve_type_hint
+from .type import _is_subhint, resolve_type_hint
 from .util import *  # noqa: F401, F403
 
 # Ensure that type checking is always entirely correct! The default O(1) strategy
@@ -58,4 +57,4 @@ def issubclass(c1, c2):
     Returns:
         bool: Whether `c1` is a subtype or sub-type hint of `c2`.
     """
-    return _TypeHint(resolve_type_hint(c1)) <= _TypeHint(resolve_type_hint(c2))
+    return _is_subhint(resolve_type_hint(c1), resolve_type_hint(c2))
@@ -1,6 +1,6 @@
 import os
 
-from .dispatcher import clear_all_cache
+from .dispatcher import clear_cache_for
 from .type import type_mapping
 
 __all__ = ["activate_autoreload", "deactivate_autoreload"]
@@ -25,8 +25,10 @@ def _update_instances(old, new):
             v = type_mapping[v]
         type_mapping[k] = v
 
-    # Since types have changed, clear the cache of everything.
-    clear_all_cache()
+    # Since `old` has changed, clear the cache of everything which depends on `old`.
+    # Everything which depended on types which mapped to `old` now depends on `old`,
+    # because type hints are resolved.
+    clear_cache_for(old)
 
 
 _update_instances_original = None
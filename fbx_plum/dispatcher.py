@@ -1,27 +1,198 @@
-from typing import Any, Dict, Optional, Tuple, TypeVar, Union
+import json
+import os
+import sys
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+from weakref import ref
 
-from .function import Function
+from ._version import __version__
+from .function import (
+    CacheabilityReport,
+    CacheInfo,
+    Function,
+    FunctionStats,
+    WarmReport,
+    _functions_by_type,
+)
+from .method import Method
 from .overload import get_overloads
 from .signature import Signature
+from .type import _clear_type_caches
 from .util import Callable, TypeHint, get_class, is_in_class
 
-__all__ = ["Dispatcher", "dispatch", "clear_all_cache"]
+__all__ = ["Dispatcher", "dispatch", "clear_all_cache", "clear_cache_for"]
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+_snapshot_format = 2
+"""int: Version of the format of the files written by :meth:`Dispatcher.save_cache`."""
+
 
 class Dispatcher:
     """A namespace for functions.
 
+    Args:
+        cache_size (int, optional): Maximum number of entries of the caches of the
+            functions. See :class:`.function.Function`. Defaults to unbounded caches.
+        weak_cache (bool, optional): Do not let the caches of the functions keep the
+            types of arguments alive. See :class:`.function.Function`. Defaults to
+            `False`.
+        warn_unfaithful (bool, optional): Emit a warning when a method which is not
+            faithful is registered. See :class:`.function.Function`. Defaults to
+            `False`.
+
     Attributes:
         functions (dict[str, :class:`.function.Function`]): Functions by name.
         classes (dict[str, dict[str, :class:`.function.Function`]]): Methods of
             all classes by the qualified name of a class.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        weak_cache: bool = False,
+        warn_unfaithful: bool = False,
+    ):
         self.functions: Dict[str, Function] = {}
         self.classes: Dict[str, Dict[str, Function]] = {}
+        self._cache_size = cache_size
+        self._weak_cache = weak_cache
+        self._warn_unfaithful = warn_unfaithful
+        self._stats_enabled = False
+        # Protects the creation of functions.
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # Locks cannot be pickled.
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def cache_size(self) -> Optional[int]:
+        """int or None: Maximum number of entries of the caches of the functions.
+        Setting this sets the maximum for all functions in the namespace."""
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, size: Optional[int]) -> None:
+        self._cache_size = size
+        for f in self._all_functions():
+            f.cache_size = size
+
+    @property
+    def weak_cache(self) -> bool:
+        """bool: Whether the caches of the functions do not keep the types of arguments
+        alive. Setting this sets it for all functions in the namespace."""
+        return self._weak_cache
+
+    @weak_cache.setter
+    def weak_cache(self, weak: bool) -> None:
+        self._weak_cache = weak
+        for f in self._all_functions():
+            f.weak_cache = weak
+
+    def _all_functions(self) -> List[Function]:
+        with self._lock:
+            functions = list(self.functions.values())
+            for namespace in self.classes.values():
+                functions.extend(namespace.values())
+        return functions
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """Get the occupancy of the caches of all functions.
+
+        Returns:
+            dict[str, :class:`.function.CacheInfo`]: Occupancy of the caches by the
+                qualified name of the function.
+        """
+        return {f.__qualname__: f.cache_info() for f in self._all_functions()}
+
+    def freeze_all(self) -> None:
+        """Freeze all functions. See :meth:`.function.Function.freeze`."""
+        for f in self._all_functions():
+            f.freeze()
+
+    def unfreeze_all(self) -> None:
+        """Unfreeze all functions. See :meth:`.function.Function.unfreeze`."""
+        for f in self._all_functions():
+            f.unfreeze()
+
+    def cacheability(self) -> Dict[str, CacheabilityReport]:
+        """Find out for all functions whether calls can be cached. See
+        :meth:`.function.Function.cacheability`.
+
+        Returns:
+            dict[str, :class:`.function.CacheabilityReport`]: Report by the qualified
+                name of the function.
+        """
+        return {f.__qualname__: f.cacheability() for f in self._all_functions()}
+
+    def enable_stats(self) -> None:
+        """Start to collect statistics of the calls of all functions, including
+        functions which are created later. See
+        :meth:`.function.Function.enable_stats`."""
+        with self._lock:
+            self._stats_enabled = True
+            for f in self._all_functions():
+                f.enable_stats()
+
+    def disable_stats(self) -> None:
+        """Stop to collect statistics of the calls of all functions and discard the
+        statistics."""
+        with self._lock:
+            self._stats_enabled = False
+            for f in self._all_functions():
+                f.disable_stats()
+
+    def stats(self) -> Dict[str, FunctionStats]:
+        """Get the statistics of the calls of all functions.
+
+        Returns:
+            dict[str, :class:`.function.FunctionStats`]: Statistics by the qualified
+                name of the function. Functions for which statistics are not
+                collected are omitted.
+        """
+        return {
+            f.__qualname__: f.stats()
+            for f in self._all_functions()
+            if f.stats() is not None
+        }
+
+    @contextmanager
+    def collect_stats(self) -> Iterator[Dict[str, FunctionStats]]:
+        """Context manager which collects statistics of the calls of all functions
+        within the context. Afterwards, statistics are collected as before.
+
+        Returns:
+            dict[str, :class:`.function.FunctionStats`]: Statistics of the calls
+                within the context by the qualified name of the function. Functions
+                which are created within the context are added when the context
+                exits.
+        """
+        enabled = self._stats_enabled
+        previous = {f: f._stats for f in self._all_functions()}
+        for f in previous:
+            f.disable_stats()
+        self.enable_stats()
+        stats = self.stats()
+        try:
+            yield stats
+        finally:
+            stats.update(self.stats())
+            self._stats_enabled = enabled
+            for f in self._all_functions():
+                f.disable_stats()
+                if f in previous:
+                    f._stats = previous[f]
+                elif enabled:
+                    f.enable_stats()
 
     def __call__(self, method: Optional[T] = None, precedence: int = 0) -> T:
         """Decorator to register for a particular signature.
@@ -87,19 +258,28 @@ class Dispatcher:
         # use the global namespace.
         if is_in_class(method):
             owner = get_class(method)
-            if owner not in self.classes:
-                self.classes[owner] = {}
-            namespace = self.classes[owner]
         else:
             owner = None
-            namespace = self.functions
-
-        # Create a new function only if the function does not already exist.
         name = method.__name__
-        if name not in namespace:
-            namespace[name] = Function(method, owner=owner)
 
-        return namespace[name]
+        # Create a new function only if the function does not already exist. Another
+        # thread might concurrently create the same function.
+        with self._lock:
+            if owner is None:
+                namespace = self.functions
+            else:
+                namespace = self.classes.setdefault(owner, {})
+            if name not in namespace:
+                namespace[name] = Function(
+                    method,
+                    owner=owner,
+                    cache_size=self._cache_size,
+                    weak_cache=self._weak_cache,
+                    warn_unfaithful=self._warn_unfaithful,
+                )
+                if self._stats_enabled:
+                    namespace[name].enable_stats()
+            return namespace[name]
 
     def _add_method(
         self,
@@ -112,17 +292,277 @@ class Dispatcher:
             f.register(method, signature, precedence)
         return f
 
+    def warm(
+        self,
+        spec: Dict[Union[str, Function], Iterable[Tuple[TypeHint, ...]]],
+        background: bool = False,
+    ) -> Union[Dict[str, WarmReport], "Future[Dict[str, WarmReport]]"]:
+        """Resolve methods for types of arguments ahead of time, so that the first
+        calls with arguments of these types hit the cache. See
+        :meth:`.function.Function.warm`.
+
+        Args:
+            spec (dict[str or :class:`.function.Function`, iterable[tuple]]): For
+                every function, the types of arguments to resolve methods for. A
+                function can be given by its name or directly, e.g. for methods of
+                classes.
+            background (bool, optional): Resolve the methods in a background thread.
+                Defaults to `False`.
+
+        Returns:
+            dict[str, :class:`.function.WarmReport`]: For every function by its
+                qualified name, the outcome of warming the cache. If `background`
+                is `True`, then this is wrapped in a
+                :class:`concurrent.futures.Future`.
+        """
+        functions = []
+        for f, type_tuples in spec.items():
+            if isinstance(f, str):
+                f = self.functions[f]
+            # Resolve pending registrations in the current thread, so the background
+            # thread only fills the cache.
+            f._resolve_pending_registrations()
+            functions.append((f, list(type_tuples)))
+
+        def warm():
+            return {f.__qualname__: f.warm(*tuples) for f, tuples in functions}
+
+        if not background:
+            return warm()
+
+        future = Future()
+
+        def run():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(warm())
+                except BaseException as e:  # pragma: no cover
+                    future.set_exception(e)
+
+        threading.Thread(target=run, name="fbx_plum-warm", daemon=True).start()
+        return future
+
+    def _namespaces(self) -> List[Tuple[Optional[str], Dict[str, Function]]]:
+        return [(None, self.functions)] + list(self.classes.items())
+
+    def save_cache(self, path: str, version: Optional[str] = None) -> None:
+        """Save the caches of all functions to a file, so other processes can start
+        with these caches by calling :meth:`Dispatcher.load_cache`.
+
+        Only entries for types which can be found by their qualified name are saved.
+        The methods of every function are saved too, so the entries of a function are
+        not loaded if methods have been added or removed since.
+
+        Args:
+            path (str): Path of the file.
+            version (str, optional): Version of your code, e.g. a hash. The caches
+                will only be loaded for the same version.
+        """
+        modules = set()
+        functions = []
+        for owner, namespace in self._namespaces():
+            for name, f in namespace.items():
+                with f._lock:
+                    f._resolve_pending_registrations()
+                    resolver = f._resolver
+                    # Calls which miss the cache add entries concurrently, so take a
+                    # snapshot of the entries.
+                    cached = list(f._cache.items())
+                methods = {}
+                for method in reversed(resolver.methods):
+                    methods[method.implementation] = method
+                entries = []
+                for key, (implementation, _) in cached:
+                    types = tuple(t() if type(t) is ref else t for t in key)
+                    # Skip methods which are not in the resolver, e.g. methods found in
+                    # the MRO.
+                    if implementation not in methods or not all(
+                        _find(*_qualified_name(t)) is t for t in types
+                    ):
+                        continue
+                    method = methods[implementation]
+                    entries.append(
+                        {
+                            "types": [_qualified_name(t) for t in types],
+                            "method": _method_id(method),
+                        }
+                    )
+                    modules.update(t.__module__ for t in types)
+                    modules.add(implementation.__module__)
+                if entries:
+                    modules.update(
+                        m.implementation.__module__ for m in resolver.methods
+                    )
+                    functions.append(
+                        {
+                            "owner": owner,
+                            "name": name,
+                            "methods": [_method_id(m) for m in resolver.methods],
+                            "entries": entries,
+                        }
+                    )
+
+        snapshot = {
+            "format": _snapshot_format,
+            "fbx_plum": __version__,
+            "version": version,
+            "modules": _module_mtimes(modules),
+            "functions": functions,
+        }
+        with open(path, "w") as f:
+            json.dump(snapshot, f)
+
+    def load_cache(self, path: str, version: Optional[str] = None) -> int:
+        """Load the caches saved by :meth:`Dispatcher.save_cache`.
+
+        The caches are only loaded if the file was saved for the same version of your
+        code and none of the modules which define the methods or types have been
+        modified since. Otherwise, nothing happens and methods will be resolved
+        as usual. The entries of a function are also not loaded if its methods differ
+        from the methods when the file was saved, e.g. because another module which
+        registers methods has been imported.
+
+        Args:
+            path (str): Path of the file.
+            version (str, optional): Version of your code, e.g. a hash. Must be equal
+                to the version given to :meth:`Dispatcher.save_cache`.
+
+        Returns:
+            int: Number of loaded entries.
+        """
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if (
+            snapshot.get("format") != _snapshot_format
+            or snapshot.get("fbx_plum") != __version__
+            or snapshot.get("version") != version
+        ):
+            return 0
+        # Only check modules which have been imported. Entries with types from other
+        # modules will not be loaded.
+        saved_mtimes = snapshot["modules"]
+        mtimes = _module_mtimes(m for m in saved_mtimes if m in sys.modules)
+        if any(saved_mtimes[m] != mtime for m, mtime in mtimes.items()):
+            return 0
+
+        loaded = 0
+        for function in snapshot["functions"]:
+            namespace = dict(self._namespaces()).get(function["owner"], {})
+            if function["name"] not in namespace:
+                continue
+            f = namespace[function["name"]]
+            with f._lock:
+                f._resolve_pending_registrations()
+                methods = {_method_id(m): m for m in f._resolver.methods}
+                if set(methods) != {tuple(m) for m in function["methods"]}:
+                    continue
+                for entry in function["entries"]:
+                    types = tuple(_find(*name) for name in entry["types"])
+                    method = methods.get(tuple(entry["method"]))
+                    if method is None or not all(isinstance(t, type) for t in types):
+                        continue
+                    key = f._cache_key(types)
+                    f._cache[key] = method.implementation, method.return_type
+                    f._track_cache_entry(key, types)
+                    loaded += 1
+        return loaded
+
     def clear_cache(self):
         """Clear cache."""
         for f in self.functions.values():
             f.clear_cache()
 
 
+def _qualified_name(x: object) -> Tuple[str, str]:
+    return getattr(x, "__module__", None), getattr(x, "__qualname__", None)
+
+
+def _find(module: Optional[str], qualname: Optional[str]) -> Optional[object]:
+    """Find an object by its qualified name.
+
+    Args:
+        module (str or None): Name of the module of the object. The module must
+            already have been imported.
+        qualname (str or None): Qualified name of the object.
+
+    Returns:
+        object or None: Object or `None` if it cannot be found.
+    """
+    if module not in sys.modules or qualname is None:
+        return None
+    x = sys.modules[module]
+    for name in qualname.split("."):
+        x = getattr(x, name, None)
+    return x
+
+
+def _method_id(method: Method) -> Tuple[Optional[str], Optional[str], str]:
+    """Identify a method across processes.
+
+    Args:
+        method (:class:`.method.Method`): Method.
+
+    Returns:
+        tuple[str or None, str or None, str]: Qualified name of the implementation and
+            the signature.
+    """
+    return _qualified_name(method.implementation) + (repr(method.signature),)
+
+
+def _module_mtimes(modules: Iterable[str]) -> Dict[str, int]:
+    """Get the last modification times of modules.
+
+    Args:
+        modules (iterable[str]): Names of modules.
+
+    Returns:
+        dict[str, int]: For every module which has been imported and is backed by a
+            file, the last modification time in nanoseconds.
+    """
+    mtimes = {}
+    for name in modules:
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path is not None:
+            try:
+                mtimes[name] = os.stat(path).st_mtime_ns
+            except OSError:  # pragma: no cover
+                pass
+    return mtimes
+
+
 def clear_all_cache():
     """Clear all cache, including the cache of subclass checks. This should be called
     if types are modified."""
+    _clear_type_caches()
     for f in Function._instances:
         f.clear_cache()
 
 
+def clear_cache_for(*types: type) -> None:
+    """Clear all cache which depends on particular types, including the cache of
+    subclass checks. This should be called if these types are modified, e.g. if they
+    are reloaded or if :class:`.type.ModuleType`\\s are retrieved.
+
+    Unlike :func:`clear_all_cache`, this only clears the cache of functions which
+    depend on the types. Functions whose methods mention one of the types reregister
+    their methods. For other functions, only the entries of the cache for arguments
+    of these types are removed.
+
+    Args:
+        *types (type): Types.
+    """
+    _clear_type_caches()
+    for t in types:
+        try:
+            functions = list(_functions_by_type.get(t, ()))
+        except TypeError:
+            # `t` cannot be weakly referenced, so no function can depend on it.
+            continue
+        for f in functions:
+            f._clear_cache_for(t)
+
+
 dispatch = Dispatcher()  #: A default dispatcher for convenience purposes.
@@ -1,17 +1,44 @@
+import inspect
 import os
+import pickle
 import textwrap
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import copy
 from functools import wraps
-from types import MethodType
-from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
+from itertools import islice
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary, WeakSet, ref
 
 from .method import Method
 from .resolver import AmbiguousLookupError, NotFoundLookupError, Resolver
-from .signature import Signature, append_default_args
-from .type import resolve_type_hint
+from .signature import Signature, _compile_match, append_default_args
+from .type import (
+    _faithful_suggestion,
+    _referenced_types,
+    _unfaithful_parts,
+    resolve_type_hint,
+)
 from .util import TypeHint, repr_short
 
-__all__ = ["Function"]
+__all__ = ["Function", "UnfaithfulWarning"]
 
 
 _promised_convert = None
@@ -42,9 +69,262 @@ def _convert(obj: Any, target_type: TypeHint) -> Any:
         return _promised_convert(obj, target_type)
 
 
-_owner_transfer = {}
+class _LRUCache(OrderedDict):
+    """A dictionary which holds at most a given number of entries. If an entry is
+    added to a full cache, then the least recently used entry is evicted.
+
+    Args:
+        max_size (int): Maximum number of entries.
+
+    Attributes:
+        max_size (int): Maximum number of entries.
+        evictions (int): Number of evicted entries.
+    """
+
+    def __init__(self, max_size: int):
+        OrderedDict.__init__(self)
+        if max_size < 1:
+            raise ValueError(f"Size of cache must be positive, but is {max_size}.")
+        self.max_size = max_size
+        self.evictions = 0
+
+    def __getitem__(self, key):
+        value = OrderedDict.__getitem__(self, key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        OrderedDict.__setitem__(self, key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+            self.evictions += 1
+
+
+def _new_cache(max_size: Optional[int]) -> dict:
+    """Construct a cache.
+
+    Args:
+        max_size (int or None): Maximum number of entries. If `None`, then the cache
+            is unbounded.
+
+    Returns:
+        dict: Cache.
+    """
+    return {} if max_size is None else _LRUCache(max_size)
+
+
+class CacheInfo(NamedTuple):
+    """Occupancy of the caches of a :class:`Function`.
+
+    Attributes:
+        size (int): Number of entries in the cache of methods by types of arguments.
+        partial_size (int): Number of entries in the cache for types of arguments
+            which might match methods which are not faithful.
+        max_size (int or None): Maximum number of entries of each of the two caches.
+            `None` means unbounded.
+        evictions (int): Total number of evicted entries.
+    """
+
+    size: int
+    partial_size: int
+    max_size: Optional[int]
+    evictions: int
+
+
+def _weak_key(types: Tuple[TypeHint, ...]) -> Tuple[object, ...]:
+    """Construct a key for a cache which does not keep the types alive.
+
+    Args:
+        types (tuple[type or type hint]): Types.
+
+    Returns:
+        tuple: `types`, but with all types which can be weakly referenced replaced by
+            weak references. Weak references compare equal if the referenced types
+            are equal.
+    """
+    key = []
+    for t in types:
+        try:
+            key.append(ref(t))
+        except TypeError:
+            # `t` cannot be weakly referenced, e.g. because it is a type hint.
+            key.append(t)
+    return tuple(key)
+
+
+class _WeakList:
+    """A list of weakly referenced objects. Objects are removed from the list when
+    they are garbage collected."""
+
+    def __init__(self):
+        self._refs = []
+
+    def append(self, x):
+        self._refs.append(ref(x, self._refs.remove))
+
+    def pop(self, i=-1):
+        return self._refs.pop(i)()
+
+    def __getitem__(self, i):
+        return self._refs[i]()
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __iter__(self):
+        # Iterate over a copy, because objects might be garbage collected during
+        # iteration.
+        for r in list(self._refs):
+            x = r()
+            if x is not None:
+                yield x
+
+
+_owner_transfer = WeakKeyDictionary()
 """dict[type, type]: When the keys of this dictionary are detected as the owner of
-a function (see :meth:`Function.owner`), make the corresponding value the owner."""
+a function (see :meth:`Function.owner`), make the corresponding value the owner. The
+keys are weakly referenced."""
+
+
+_functions_by_type = WeakKeyDictionary()
+"""dict[type, set[:class:`Function`]]: For every type, the functions whose methods or
+caches might depend on the type. Both the types and the functions are weakly
+referenced."""
+
+
+class WarmReport(NamedTuple):
+    """Outcome of warming the cache of a :class:`Function`. See
+    :meth:`Function.warm`.
+
+    Attributes:
+        resolved (list[tuple[type, ...]]): Types of arguments for which a method was
+            found.
+        ambiguous (list[tuple[type, ...]]): Types of arguments for which the method
+            is ambiguous.
+        not_found (list[tuple[type, ...]]): Types of arguments for which no method
+            was found.
+    """
+
+    resolved: List[Tuple[TypeHint, ...]]
+    ambiguous: List[Tuple[TypeHint, ...]]
+    not_found: List[Tuple[TypeHint, ...]]
+
+
+class UnfaithfulWarning(UserWarning):
+    """A method of a function is not faithful, so calls which might match the method
+    cannot be fully cached."""
+
+
+class UnfaithfulHint(NamedTuple):
+    """A type hint which makes a method of a :class:`Function` not faithful.
+
+    Attributes:
+        signature (:class:`.signature.Signature`): Signature of the method.
+        hint (type or type hint): Type hint in `signature` which is not faithful.
+        part (type or type hint): Part of `hint` which is not faithful, e.g. an
+            element of a union.
+        suggestion (str or None): Suggestion how to make `part` faithful, if any.
+    """
+
+    signature: Signature
+    hint: TypeHint
+    part: TypeHint
+    suggestion: Optional[str]
+
+
+class CacheabilityReport(NamedTuple):
+    """Whether calls of a :class:`Function` can be cached. See
+    :meth:`Function.cacheability`.
+
+    Attributes:
+        cacheable (bool): Whether all methods are faithful. If this is `False`, then,
+            for calls with arguments whose types might match a method which is not
+            faithful, the methods which are not faithful must be checked every call.
+        unfaithful (list[:class:`.function.UnfaithfulHint`]): Type hints which make
+            methods not faithful.
+    """
+
+    cacheable: bool
+    unfaithful: List[UnfaithfulHint]
+
+
+def _unfaithful_hints(signature: Signature) -> List[UnfaithfulHint]:
+    """Find the type hints which make a signature not faithful.
+
+    Args:
+        signature (:class:`.signature.Signature`): Signature.
+
+    Returns:
+        list[:class:`.function.UnfaithfulHint`]: Type hints which are not faithful.
+    """
+    hints = list(signature.types)
+    if signature.has_varargs:
+        hints.append(signature.varargs)
+    return [
+        UnfaithfulHint(signature, hint, part, _faithful_suggestion(part))
+        for hint in hints
+        for part in _unfaithful_parts(hint)
+    ]
+
+
+class FunctionStats:
+    """Statistics of the calls of a :class:`Function`. See
+    :meth:`Function.enable_stats`.
+
+    Attributes:
+        calls (int): Number of calls.
+        hits (int): Number of calls for which the method was found in the cache.
+        partial (int): Number of calls for which the types of the arguments might
+            match methods which are not faithful, so these methods had to be checked.
+        misses (int): Number of calls for which the method had to be resolved.
+        not_found (int): Number of calls for which no method was found.
+        ambiguous (int): Number of calls for which the method was ambiguous.
+        mro_fallbacks (int): Number of resolutions for which no method was found, but
+            for which a method of a parent of the owner was used.
+        resolution_time (int): Total time in nanoseconds spent to resolve methods for
+            calls which did not hit the cache.
+        resolution_times (dict[int, int]): Histogram of the times to resolve methods
+            for calls which did not hit the cache. A bucket `b`, which is a power of
+            two, counts the resolutions which took at least `b // 2` nanoseconds, but
+            less than `b` nanoseconds.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.partial = 0
+        self.misses = 0
+        self.not_found = 0
+        self.ambiguous = 0
+        self.mro_fallbacks = 0
+        self.resolution_time = 0
+        self.resolution_times: Dict[int, int] = {}
+
+    @property
+    def hit_rate(self) -> float:
+        """float: Fraction of the calls which hit the cache. Zero if there were no
+        calls."""
+        return self.hits / self.calls if self.calls else 0.0
+
+    def _record(self, duration: int) -> None:
+        """Record the time to resolve a method.
+
+        Args:
+            duration (int): Time in nanoseconds.
+        """
+        self.resolution_time += duration
+        bucket = 1 << duration.bit_length()
+        self.resolution_times[bucket] = self.resolution_times.get(bucket, 0) + 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<FunctionStats calls={self.calls} hits={self.hits} "
+            f"partial={self.partial} misses={self.misses} "
+            f"not_found={self.not_found} ambiguous={self.ambiguous} "
+            f"mro_fallbacks={self.mro_fallbacks} "
+            f"resolution_time={self.resolution_time}ns>"
+        )
 
 
 class _FunctionMeta(type):
@@ -63,19 +343,50 @@ class Function(metaclass=_FunctionMeta):
     Args:
         f (function): Function that is wrapped.
         owner (str, optional): Name of the class that owns the function.
+        cache_size (int, optional): Maximum number of entries of the caches. If an
+            entry is added to a full cache, the least recently used entry is evicted.
+            Defaults to unbounded caches.
+        weak_cache (bool, optional): Do not let the caches keep the types of
+            arguments alive. When such a type is garbage collected, all entries of the
+            caches for that type are removed. This makes calls slightly slower.
+            Defaults to `False`.
+        warn_unfaithful (bool, optional): Emit a :class:`.function.UnfaithfulWarning`
+            when a method which is not faithful is registered. Defaults to `False`.
     """
 
     # When we set `__doc__`, we will lose the docstring of the class, so we save it now.
     # Correctly printing the docstring is handled by :class:`_FunctionMeta`.
     _class_doc = __doc__
 
-    _instances = []
+    _instances = _WeakList()
 
-    def __init__(self, f: Callable, owner: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        f: Callable,
+        owner: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        weak_cache: bool = False,
+        warn_unfaithful: bool = False,
+    ) -> None:
         Function._instances.append(self)
 
         self._f: Callable = f
-        self._cache = {}
+        self._cache_size = cache_size
+        self._weak_cache = weak_cache
+        self._warn_unfaithful = warn_unfaithful
+        # Methods are registered again whenever the caches are cleared, so remember
+        # for which methods a warning has been emitted to emit it only once.
+        self._warned_unfaithful: Set[Tuple[Callable, str]] = set()
+        # If the caches are weak, then this maps a weak reference to a type to a weak
+        # reference with a callback for when the type is garbage collected and the
+        # keys of the caches which contain the type.
+        self._cache_refs = {}
+        self._cache = _new_cache(cache_size)
+        # For types of arguments which might match methods which are not faithful, the
+        # methods which are not faithful must be checked. This cache maps such types
+        # to those methods, the checks whether arguments match those methods, and a
+        # cache for the outcome of those checks.
+        self._partial_cache = _new_cache(cache_size)
         wraps(f)(self)  # Sets `self._doc`.
 
         # `owner` is the name of the owner. We will later attempt to resolve to
@@ -83,10 +394,37 @@ class Function(metaclass=_FunctionMeta):
         self._owner_name: Optional[str] = owner
         self._owner: Optional[type] = None
 
-        # Initialise pending and resolved methods.
+        # Registering methods and invalidating the caches happen under this lock.
+        # Calls which hit the cache do not acquire the lock.
+        self._lock = threading.RLock()
+
+        # Initialise pending and resolved methods. Once the resolver is set, it is not
+        # modified, so calls can use the resolver without acquiring the lock.
         self._pending: List[Tuple[Callable, Optional[Signature], int]] = []
         self._resolver = Resolver(function_name=self.__name__)
         self._resolved: List[Tuple[Callable, Signature, int]] = []
+        # All types which occur in the signatures and return types of the methods.
+        self._method_types = set()
+
+        # Statistics of the calls, or `None` if they are not collected.
+        self._stats: Optional[FunctionStats] = None
+        # Whether the function is frozen. See :meth:`Function.freeze`. If it is, then
+        # this maps the IDs of the methods which are not faithful to the methods and
+        # compiled versions of :meth:`.signature.Signature.match`.
+        self._frozen = False
+        self._matchers: Dict[int, Tuple[Method, Callable]] = {}
+
+        # Calls are forwarded to `self._call`. Until the methods are resolved, this
+        # resolves pending registrations and generates a specialised implementation.
+        self._call: Callable = self._call_pending
+        # Incremented whenever `self._call` is reset, e.g. when a method is registered.
+        # Caches outside the function which depend on its methods can compare this to
+        # check whether they are still valid.
+        self._generation = 0
+        # Incremented when the caches start to be cleared and again when clearing is
+        # done. Calls which resolved a method in the meantime must not store the
+        # outcome in the caches. See :meth:`Function._clearing_caches`.
+        self._invalidations = 0
 
     @property
     def owner(self):
@@ -119,9 +457,9 @@ class Function(metaclass=_FunctionMeta):
             # defined, so attempting to resolve all pending methods might fail with a
             # `NameError`. This is fine, because later calling `__doc__` on the
             # `staticmethod` will again call this `__doc__`, at which point all methods
-            # will resolve properly. For now, we just ignore the error and undo the
-            # partially completed :meth:`Function._resolve_pending_registrations` by
-            # clearing the cache.
+            # will resolve properly. For now, we just ignore the error. The failed
+            # :meth:`Function._resolve_pending_registrations` leaves all methods
+            # pending, but clear the cache to be sure.
             self.clear_cache(reregister=False)
 
         # Don't do any fancy appending of docstrings when the environment variable
@@ -183,6 +521,31 @@ class Function(metaclass=_FunctionMeta):
         self.register(method, precedence=precedence)
         return self
 
+    def dispatch_batch(
+        self: Self, method: Optional[Callable] = None, precedence=0
+    ) -> Union[Self, Callable[[Callable], Self]]:
+        """Decorator to extend the function with a batch implementation of a method.
+
+        The types of the arguments and the return type of a batch implementation are
+        the types of single arguments and results, but a batch implementation is
+        called with, for every argument, a list of arguments. It must return a
+        sequence of results of the same length. :meth:`Function.map` and
+        :meth:`Function.starmap` call a batch implementation once for all
+        arguments of the same types. Other calls call the batch implementation with
+        lists of length one.
+
+        Args:
+            precedence (int, optional): Precedence of the signature. Defaults to `0`.
+
+        Returns:
+            function: Decorator.
+        """
+        if method is None:
+            return lambda m: self.dispatch_batch(m, precedence=precedence)
+
+        self.register(_batch_method(method), precedence=precedence)
+        return self
+
     def dispatch_multi(
         self: Self, *signatures: Union[Signature, Tuple[TypeHint, ...]]
     ) -> Callable[[Callable], Self]:
@@ -215,6 +578,137 @@ class Function(metaclass=_FunctionMeta):
 
         return decorator
 
+    @property
+    def cache_size(self) -> Optional[int]:
+        """int or None: Maximum number of entries of the caches. `None` means
+        unbounded. Setting this clears the caches."""
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, size: Optional[int]) -> None:
+        with self._lock:
+            self._cache = _new_cache(size)
+            self._partial_cache = _new_cache(size)
+            self._cache_refs.clear()
+            self._cache_size = size
+            # The implementation of calls refers to the cache, so it must be
+            # regenerated.
+            self._reset_call()
+
+    @property
+    def weak_cache(self) -> bool:
+        """bool: Whether the caches do not keep the types of arguments alive. Setting
+        this clears the caches."""
+        return self._weak_cache
+
+    @weak_cache.setter
+    def weak_cache(self, weak: bool) -> None:
+        with self._lock:
+            self._weak_cache = weak
+            self.clear_cache(reregister=False)
+            # The implementation of calls depends on this, so it must be regenerated.
+            self._reset_call()
+
+    def _track_key(self, key: Tuple[object, ...]) -> None:
+        """For a weak cache, remove the entries for `key` from the caches when any of
+        the types in `key` is garbage collected.
+
+        Args:
+            key (tuple): Key constructed with :func:`_weak_key`.
+        """
+        for t_ref in key:
+            if type(t_ref) is not ref:
+                continue
+            try:
+                keys = self._cache_refs[t_ref][1]
+            except KeyError:
+                t = t_ref()
+                if t is None:  # pragma: no cover
+                    # The type has already been garbage collected.
+                    continue
+
+                def callback(_, t_ref=t_ref):
+                    self._evict_type(t_ref)
+
+                keys = set()
+                self._cache_refs[t_ref] = ref(t, callback), keys
+            keys.add(key)
+
+    def _evict_type(self, t_ref: ref) -> None:
+        """Remove all entries for a type from the caches.
+
+        Args:
+            t_ref (weakref): Weak reference to the type.
+        """
+        try:
+            _, keys = self._cache_refs.pop(t_ref)
+        except KeyError:
+            return
+        for key in keys:
+            self._cache.pop(key, None)
+            self._partial_cache.pop(key, None)
+            # Also remove the key from the other types in the key.
+            for other in key:
+                if other is not t_ref and other in self._cache_refs:
+                    self._cache_refs[other][1].discard(key)
+
+    def cache_info(self) -> CacheInfo:
+        """Get the occupancy of the caches.
+
+        Returns:
+            :class:`.function.CacheInfo`: Occupancy of the caches.
+        """
+        return CacheInfo(
+            size=len(self._cache),
+            partial_size=len(self._partial_cache),
+            max_size=self._cache_size,
+            evictions=sum(
+                getattr(cache, "evictions", 0)
+                for cache in (self._cache, self._partial_cache)
+            ),
+        )
+
+    def enable_stats(self) -> None:
+        """Start to collect statistics of the calls. Until
+        :meth:`Function.disable_stats` is called, calls are slightly slower. If
+        statistics are already collected, this does nothing."""
+        if self._stats is None:
+            self._stats = FunctionStats()
+            # Calls must be instrumented, so the implementation must be regenerated.
+            self._reset_call()
+
+    def disable_stats(self) -> None:
+        """Stop to collect statistics of the calls and discard the statistics."""
+        self._stats = None
+        self._reset_call()
+
+    def stats(self) -> Optional[FunctionStats]:
+        """Get the statistics of the calls.
+
+        Returns:
+            :class:`.function.FunctionStats` or None: Statistics or `None` if
+                statistics are not collected.
+        """
+        return self._stats
+
+    @contextmanager
+    def collect_stats(self) -> Iterator[FunctionStats]:
+        """Context manager which collects statistics of the calls within the context.
+        Afterwards, the previous statistics are restored.
+
+        Returns:
+            :class:`.function.FunctionStats`: Statistics of the calls within the
+                context.
+        """
+        previous = self._stats
+        self._stats = FunctionStats()
+        self._reset_call()
+        try:
+            yield self._stats
+        finally:
+            self._stats = previous
+            self._reset_call()
+
     def clear_cache(self, reregister: bool = True) -> None:
         """Clear cache.
 
@@ -222,15 +716,80 @@ class Function(metaclass=_FunctionMeta):
             reregister (bool, optional): Also reregister all methods. Defaults to
                 `True`.
         """
-        self._cache.clear()
+        with self._clearing_caches():
+            self._cache.clear()
+            self._partial_cache.clear()
+            self._cache_refs.clear()
+
+            if reregister:
+                # Add all resolved to pending. Keep the order of registration, so
+                # methods registered later still override equal earlier ones.
+                self._pending = self._resolved + self._pending
+                self._reset_call()
+
+                # Clear resolved.
+                self._resolved = []
+                self._resolver = Resolver(function_name=self.__name__)
+                self._method_types = set()
+            else:
+                # The resolver remembers which methods accept which types, which might
+                # have changed too.
+                self._resolver.clear_cache()
+
+    @contextmanager
+    def _clearing_caches(self) -> Iterator[None]:
+        """Context manager within which entries of the caches can be removed and the
+        resolver can be replaced.
+
+        The counter of invalidations is odd within the context. Calls which resolve a
+        method therefore do not use the resolver whilst it is replaced, and calls which
+        store an outcome whilst or after the caches are cleared remove the entry again.
+        """
+        with self._lock:
+            self._invalidations += 1
+            try:
+                yield
+            finally:
+                self._invalidations += 1
 
-        if reregister:
-            # Add all resolved to pending.
-            self._pending.extend(self._resolved)
+    def _clear_cache_for(self, t: type) -> None:
+        """Clear all cache which depends on a type. See
+        :func:`.dispatcher.clear_cache_for`.
+
+        Args:
+            t (type): Type.
+        """
+        if t in self._method_types:
+            # The methods must be registered again.
+            self.clear_cache()
+        else:
+            # Only the entries of the caches for arguments of type `t` depend on `t`.
+            probe = _weak_key((t,))[0] if self._weak_cache else t
+            with self._clearing_caches():
+                for cache in (self._cache, self._partial_cache):
+                    for key in [key for key in cache if probe in key]:
+                        del cache[key]
+                # The resolver remembers which methods accept `t` and subclasses of
+                # `t`, which might have changed too.
+                self._resolver.clear_cache()
+
+    def _depend_on(self, types) -> None:
+        """Register that this function depends on types. See
+        :func:`.dispatcher.clear_cache_for`.
 
-            # Clear resolved.
-            self._resolved = []
-            self._resolver = Resolver()
+        Args:
+            types (iterable[type]): Types.
+        """
+        for t in types:
+            try:
+                functions = _functions_by_type[t]
+            except KeyError:
+                # Another thread might concurrently add the type.
+                functions = _functions_by_type.setdefault(t, WeakSet())
+            except TypeError:  # pragma: no cover
+                # `t` cannot be weakly referenced.
+                continue
+            functions.add(self)
 
     def register(
         self, f: Callable, signature: Optional[Signature] = None, precedence=0
@@ -245,17 +804,37 @@ class Function(metaclass=_FunctionMeta):
                 not given, it will be derived from `f`.
             precedence (int, optional): Precedence of the function. If `signature` is
                 given, then this argument will not be used. Defaults to `0`.
+
+        Raises:
+            RuntimeError: If the function is frozen.
         """
-        self._pending.append((f, signature, precedence))
+        with self._lock:
+            if self._frozen:
+                raise RuntimeError(
+                    f"Function `{self.__qualname__}` is frozen, so no methods can be "
+                    f"registered. Call `unfreeze` first."
+                )
+            self._pending.append((f, signature, precedence))
+            self._reset_call()
 
     def _resolve_pending_registrations(self) -> None:
-        # Keep track of whether anything registered.
-        registered = False
+        with self._lock:
+            if self._pending:
+                self._register_pending()
+
+    def _register_pending(self) -> None:
+        """Register the pending methods with a copy of the resolver, and then replace
+        the resolver by the copy. Calls which concurrently resolve methods therefore
+        either use the old or the new resolver. If registration fails, nothing
+        changes. Must be called with the lock acquired."""
+        resolver = copy(self._resolver)
+        resolved = list(self._resolved)
+        method_types = set(self._method_types)
 
         # Perform any pending registrations.
         for f, signature, precedence in self._pending:
             # Add to resolved registrations.
-            self._resolved.append((f, signature, precedence))
+            resolved.append((f, signature, precedence))
 
             # Obtain the signature if it is not available.
             if signature is None:
@@ -265,17 +844,74 @@ class Function(metaclass=_FunctionMeta):
                 # mutating.
                 signature = copy(signature)
 
+            if self._warn_unfaithful and not signature.is_faithful:
+                self._warn_unfaithful_signature(signature, f)
+
             # Process default values.
             for subsignature in append_default_args(signature, f):
                 submethod = Method(f, subsignature, function_name=self.__name__)
-                self._resolver.register(submethod)
-                registered = True
+                resolver.register(submethod)
 
-        if registered:
-            self._pending = []
+                types = _referenced_types(subsignature.types)
+                if subsignature.has_varargs:
+                    types |= _referenced_types(subsignature.varargs)
+                types |= _referenced_types(submethod.return_type)
+                method_types |= types
+                self._depend_on(types)
 
-            # Clear cache.
-            self.clear_cache(reregister=False)
+        self._resolver = resolver
+        self._resolved = resolved
+        self._method_types = method_types
+        self._pending = []
+
+        # Clear cache.
+        self.clear_cache(reregister=False)
+
+    def _warn_unfaithful_signature(self, signature: Signature, f: Callable) -> None:
+        """Emit a :class:`.function.UnfaithfulWarning` for a signature. The warning
+        is attributed to the definition of the method, because methods are only
+        registered when the function is first used. The warning is emitted only once
+        for every method.
+
+        Args:
+            signature (:class:`.signature.Signature`): Signature which is not
+                faithful.
+            f (function): Implementation of the method.
+        """
+        key = (f, repr(signature))
+        if key in self._warned_unfaithful:
+            return
+        self._warned_unfaithful.add(key)
+        code = getattr(f, "__code__", None)
+        for unfaithful in _unfaithful_hints(signature):
+            message = (
+                f"Method `{signature}` of function `{self.__qualname__}` is not "
+                f"faithful, because `{repr_short(unfaithful.part)}` is not faithful. "
+                f"Calls which might match this method cannot be fully cached."
+            )
+            if unfaithful.suggestion:
+                message += " " + unfaithful.suggestion
+            warnings.warn_explicit(
+                message,
+                UnfaithfulWarning,
+                filename=getattr(code, "co_filename", "<unknown>"),
+                lineno=getattr(code, "co_firstlineno", 0),
+                module=getattr(f, "__module__", None),
+            )
+
+    def cacheability(self) -> CacheabilityReport:
+        """Find out whether calls can be cached and, if not, which type hints of
+        which methods prevent this.
+
+        Returns:
+            :class:`.function.CacheabilityReport`: Report.
+        """
+        self._resolve_pending_registrations()
+        unfaithful = []
+        for method in self._resolver.methods:
+            if not method.signature.is_faithful:
+                unfaithful.extend(_unfaithful_hints(method.signature))
+        return CacheabilityReport(self._resolver.is_faithful, unfaithful)
 
     def _enhance_exception(self, e: SomeExceptionType) -> SomeExceptionType:
         """Enchance an exception by prepending a prefix to the message of the exception
@@ -308,11 +944,35 @@ class Function(metaclass=_FunctionMeta):
             function: Method.
             type: Return type.
         """
-        self._resolve_pending_registrations()
+        return self._resolve_method(target, self._snapshot()[0])
 
+    def _snapshot(self) -> Tuple[Resolver, int]:
+        """Resolve all pending registrations and get the current resolver.
+
+        Returns:
+            :class:`.resolver.Resolver`: Resolver, which will not be modified.
+            int: Number of times that the caches have been cleared. If this changes,
+                then outcomes obtained with the resolver must not be stored in the
+                caches.
+        """
+        # If the counter is even and did not change and no methods are pending, then
+        # the resolver is current. In that case, the lock is not acquired.
+        invalidations = self._invalidations
+        resolver = self._resolver
+        if self._pending or invalidations % 2 or self._invalidations != invalidations:
+            with self._lock:
+                self._resolve_pending_registrations()
+                return self._resolver, self._invalidations
+        return resolver, invalidations
+
+    def _resolve_method(
+        self, target: Union[Tuple[object, ...], Signature], resolver: Resolver
+    ) -> Tuple[Callable, TypeHint]:
+        """Find the method and return type for arguments with a particular resolver.
+        See :meth:`Function.resolve_method`."""
         try:
             # Attempt to find the method using the resolver.
-            method = self._resolver.resolve(target)
+            method = resolver.resolve(target)
             impl = method.implementation
             return_type = method.return_type
 
@@ -325,6 +985,8 @@ class Function(metaclass=_FunctionMeta):
 
             e = self._enhance_exception(e)  # Specify this function.
             impl, return_type = self._handle_not_found_lookup_error(e)
+            if self._stats is not None:
+                self._stats.mro_fallbacks += 1
 
         return impl, return_type
 
@@ -373,8 +1035,102 @@ class Function(metaclass=_FunctionMeta):
 
     def __call__(self, *args, **kw_args):
         __tracebackhide__ = True
-        method, return_type = self._resolve_method_with_cache(args=args)
-        return _convert(method(*args, **kw_args), return_type)
+        return self._call(*args, **kw_args)
+
+    def _call_pending(self, *args, **kw_args):
+        """Call the function after resolving all pending registrations. This replaces
+        itself with a call specialised to the registered methods. See
+        :func:`_generate_call`."""
+        __tracebackhide__ = True
+        # Generate the implementation under the lock, so a method which is registered
+        # concurrently resets the generated implementation only after it is installed.
+        with self._lock:
+            self._resolve_pending_registrations()
+            call = self._call = _generate_call(self)
+            if self._frozen:
+                self._install_frozen_call()
+        return call(*args, **kw_args)
+
+    def _reset_call(self) -> None:
+        """Let the next call regenerate the implementation of calls. This must be
+        called whenever something changes on which the implementation depends."""
+        with self._lock:
+            self._call = self._call_pending
+            self._generation += 1
+            if type(self).__dict__.get("_frozen_call", False):
+                # Remove the frozen implementation of calls. It will be installed again
+                # by :meth:`Function._call_pending`.
+                self.__class__ = type(self).__base__
+
+    def _install_frozen_call(self) -> None:
+        """Compile the checks of the methods which are not faithful and, unless
+        statistics are collected, let the generated implementation of calls directly
+        implement `__call__`. See :meth:`Function.freeze`."""
+        self._matchers = {
+            id(m): (m, _compile_match(m.signature))
+            for m in self._resolver.methods
+            if not m.signature.is_faithful
+        }
+        # Entries of the partial cache might refer to the uncompiled checks.
+        self._partial_cache.clear()
+        if self._stats is None and not type(self).__dict__.get("_frozen_call", False):
+            self.__class__ = _frozen_class(type(self), _generate_call(self, bound=True))
+
+    @property
+    def frozen(self) -> bool:
+        """bool: Whether the function is frozen. See :meth:`Function.freeze`."""
+        return self._frozen
+
+    def freeze(self) -> Self:
+        """Freeze the function: resolve all pending registrations and generate an
+        implementation of calls which is specialised to the methods. This makes calls
+        faster. Once the function is frozen, no methods can be registered until
+        :meth:`Function.unfreeze` is called.
+
+        For methods which are faithful, calls look up the method by the types of the
+        arguments. For methods which are not faithful, the checks whether arguments
+        match the method are compiled.
+
+        Returns:
+            :class:`.function.Function`: `self`.
+        """
+        with self._lock:
+            self._resolve_pending_registrations()
+            self._frozen = True
+            self._call = _generate_call(self)
+            self._install_frozen_call()
+        return self
+
+    def unfreeze(self) -> Self:
+        """Unfreeze the function, so methods can be registered again. See
+        :meth:`Function.freeze`.
+
+        Returns:
+            :class:`.function.Function`: `self`.
+        """
+        with self._lock:
+            self._frozen = False
+            self._matchers = {}
+            self._partial_cache.clear()
+            self._reset_call()
+        return self
+
+    def _matcher(self, method: Method) -> Callable[[Tuple[object, ...]], bool]:
+        """Get a function which checks whether arguments match a method.
+
+        Args:
+            method (:class:`.method.Method`): Method.
+
+        Returns:
+            function: Function which takes in a tuple of arguments and returns whether
+                the arguments match `method`.
+        """
+        try:
+            m, match = self._matchers[id(method)]
+        except KeyError:
+            return method.signature.match
+        # The ID might have been reused by another method.
+        return match if m is method else method.signature.match
 
     def _resolve_method_with_cache(
         self,
@@ -395,22 +1151,316 @@ class Function(metaclass=_FunctionMeta):
         if types is None:
             # Attempt to use the cache based on the types of the arguments.
             types = tuple(map(type, args))
+        key = self._cache_key(types)
         try:
-            return self._cache[types]
+            return self._cache[key]
         except KeyError:
             __tracebackhide__ = True
 
             if args is None:
                 args = Signature(*(resolve_type_hint(t) for t in types))
+                by_types = True
+            else:
+                if key in self._partial_cache:
+                    return self._resolve_method_partially(key, args)
+                by_types = False
 
             # Cache miss. Run the resolver based on the arguments.
-            method, return_type = self.resolve_method(args)
+            resolver, invalidations = self._snapshot()
+            method, return_type = self._resolve_method(args, resolver)
             # If the resolver is faithful, then we can perform caching using the types
-            # of the arguments. If the resolver is not faithful, then we cannot.
-            if self._resolver.is_faithful:
-                self._cache[types] = method, return_type
+            # of the arguments.
+            entry = None
+            if resolver.is_faithful:
+                entry = self._cache, (method, return_type)
+            elif not by_types:
+                # The resolver is not faithful. If no method which is not faithful can
+                # match arguments of these types, then we can still perform caching
+                # using the types of the arguments. Otherwise, only the methods which
+                # are not faithful need to be checked for future calls.
+                candidates = resolver.unfaithful_candidates(types)
+                if candidates:
+                    matchers = tuple(self._matcher(m) for m in candidates)
+                    matches = tuple(match(args) for match in matchers)
+                    results = {matches: (method, return_type)}
+                    entry = self._partial_cache, (candidates, matchers, results)
+                else:
+                    entry = self._cache, (method, return_type)
+            elif not resolver.unfaithful_candidates(types):
+                # The method was resolved using only the types. If no method which is
+                # not faithful can match arguments of these types, then resolving
+                # using arguments of these types gives the same method.
+                entry = self._cache, (method, return_type)
+            if entry is not None:
+                cache, value = entry
+                cache[key] = value
+                if self._invalidations != invalidations:
+                    # A method was registered or the caches were cleared in the
+                    # meantime, so the outcome might be outdated.
+                    cache.pop(key, None)
+                else:
+                    self._track_cache_entry(key, types)
             return method, return_type
 
+    def _track_cache_entry(self, key: Tuple[object, ...], types: Tuple[TypeHint, ...]):
+        """Keep track of a new entry of the caches.
+
+        Args:
+            key (tuple): Key of the entry.
+            types (tuple[type or type hint, ...]): Types from which `key` was
+                constructed.
+        """
+        self._depend_on(t for t in types if isinstance(t, type))
+        if self._weak_cache:
+            self._track_key(key)
+
+    def _cache_key(self, types: Tuple[TypeHint, ...]) -> Tuple[object, ...]:
+        """Construct the key of the caches for types of arguments.
+
+        Args:
+            types (tuple[type or type hint, ...]): Types of arguments.
+
+        Returns:
+            tuple: Key.
+        """
+        return _weak_key(types) if self._weak_cache else types
+
+    def _resolve_method_partially(
+        self, key: Tuple[object, ...], args: Tuple[object, ...]
+    ) -> Tuple[Callable, TypeHint]:
+        """Resolve a method for arguments whose types might match methods which are
+        not faithful. Only the methods which are not faithful are checked.
+
+        Args:
+            key (tuple): Key of the cache for the types of the arguments.
+            args (tuple[object]): Arguments.
+
+        Returns:
+            function: Method.
+            type: Return type.
+        """
+        __tracebackhide__ = True
+        try:
+            _, matchers, results = self._partial_cache[key]
+        except KeyError:
+            # The caches were cleared in the meantime.
+            return self.resolve_method(args)
+        # The types of the arguments determine which faithful methods match, so the
+        # outcome is determined by which of the other methods match.
+        matches = tuple(match(args) for match in matchers)
+        try:
+            return results[matches]
+        except KeyError:
+            result = results[matches] = self.resolve_method(args)
+            return result
+
+    def warm(self, *type_tuples: Tuple[TypeHint, ...]) -> WarmReport:
+        """Resolve methods for types of arguments ahead of time, so that the first
+        calls with arguments of these types hit the cache.
+
+        Args:
+            *type_tuples (tuple[type, ...]): Types of arguments.
+
+        Returns:
+            :class:`.function.WarmReport`: Which types of arguments were resolved,
+                were ambiguous, or could not be resolved.
+        """
+        report = WarmReport([], [], [])
+        for types in type_tuples:
+            types = tuple(types)
+            try:
+                self._resolve_method_with_cache(types=types)
+            except AmbiguousLookupError:
+                report.ambiguous.append(types)
+            except NotFoundLookupError:
+                report.not_found.append(types)
+            else:
+                report.resolved.append(types)
+        return report
+
+    def map(
+        self,
+        iterable: Iterable[object],
+        stream: bool = False,
+        chunksize: int = 1024,
+    ) -> Union[List[object], Iterator[object]]:
+        """Call the function for every element of an iterable.
+
+        The elements are grouped by their types, and the method is resolved once per
+        group. Within a group, the methods are called in the order of the elements,
+        but the groups are processed one after the other.
+
+        Args:
+            iterable (iterable[object]): Arguments.
+            stream (bool, optional): Return a generator which processes `chunksize`
+                elements at a time instead of a list. Defaults to `False`.
+            chunksize (int, optional): Number of elements which are grouped at a time
+                if `stream` is `True`. Defaults to `1024`.
+
+        Returns:
+            list[object] or iterator[object]: Results in the order of `iterable`.
+        """
+        if stream:
+            return self._map_stream(iterable, chunksize, star=False)
+        else:
+            return self._map_chunk(list(iterable), star=False)
+
+    def starmap(
+        self,
+        iterable: Iterable[Iterable[object]],
+        stream: bool = False,
+        chunksize: int = 1024,
+    ) -> Union[List[object], Iterator[object]]:
+        """Like :meth:`Function.map`, but call the function with every element of
+        `iterable` as arguments.
+
+        Args:
+            iterable (iterable[iterable[object]]): Arguments.
+            stream (bool, optional): Return a generator which processes `chunksize`
+                elements at a time instead of a list. Defaults to `False`.
+            chunksize (int, optional): Number of elements which are grouped at a time
+                if `stream` is `True`. Defaults to `1024`.
+
+        Returns:
+            list[object] or iterator[object]: Results in the order of `iterable`.
+        """
+        if stream:
+            return self._map_stream(iterable, chunksize, star=True)
+        else:
+            return self._map_chunk(list(iterable), star=True)
+
+    def pmap(
+        self,
+        iterable: Iterable[object],
+        executor: Optional[Executor] = None,
+        chunksize: int = 1024,
+        star: bool = False,
+    ) -> List[object]:
+        """Like :meth:`Function.map`, but process chunks of `iterable` in parallel.
+
+        Every chunk is sent to `executor`, which calls :meth:`Function.map` for the
+        chunk. For a :class:`concurrent.futures.ProcessPoolExecutor`, the function,
+        the arguments, and the results must be picklable. The workers then first
+        resolve the methods for the types of arguments for which this process has
+        already resolved the methods.
+
+        Args:
+            iterable (iterable[object]): Arguments.
+            executor (:class:`concurrent.futures.Executor`, optional): Executor.
+                Defaults to a new :class:`concurrent.futures.ProcessPoolExecutor`,
+                which is shut down afterwards.
+            chunksize (int, optional): Number of elements which are sent to the
+                executor at a time. Defaults to `1024`.
+            star (bool, optional): Call the function with every element of
+                `iterable` as arguments, like :meth:`Function.starmap`. Defaults to
+                `False`.
+
+        Returns:
+            list[object]: Results in the order of `iterable`.
+        """
+        if executor is None:
+            with ProcessPoolExecutor() as executor:
+                return self.pmap(iterable, executor, chunksize, star)
+
+        if isinstance(executor, ThreadPoolExecutor):
+            # Threads share the caches of this process.
+            warm = None
+        else:
+            warm = self._pickled_cache_types()
+        futures = [
+            executor.submit(_pmap_chunk, self, warm, chunk, star)
+            for chunk in _chunks(iterable, chunksize)
+        ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _pickled_cache_types(self) -> Optional[bytes]:
+        """Pickle the types of arguments for which the methods are cached.
+
+        Returns:
+            bytes or None: Pickled list of types of arguments, or `None` if the cache
+                is empty. Types of arguments which cannot be pickled are omitted.
+        """
+        type_tuples = []
+        for key in list(self._cache):
+            types = tuple(t() if type(t) is ref else t for t in key)
+            try:
+                pickle.dumps(types)
+            except Exception:
+                # For example, the types are defined locally.
+                continue
+            type_tuples.append(types)
+        return pickle.dumps(type_tuples) if type_tuples else None
+
+    def _map_stream(
+        self, iterable: Iterable[object], chunksize: int, star: bool
+    ) -> Iterator[object]:
+        """Implementation of :meth:`Function.map` and :meth:`Function.starmap` for
+        `stream=True`."""
+        for chunk in _chunks(iterable, chunksize):
+            yield from self._map_chunk(chunk, star)
+
+    def _map_chunk(self, chunk: List[object], star: bool) -> List[object]:
+        """Call the function for every element of a chunk. See :meth:`Function.map`.
+
+        Args:
+            chunk (list[object]): Arguments or, if `star` is `True`, iterables of
+                arguments.
+            star (bool): Whether the elements of `chunk` are iterables of arguments.
+
+        Returns:
+            list[object]: Results.
+        """
+        if star:
+            chunk = [args if type(args) is tuple else tuple(args) for args in chunk]
+            arities = set(map(len, chunk))
+            if len(arities) == 1:
+                # All elements have the same number of arguments. Then determining the
+                # types column by column is much faster than element by element.
+                if arities == {0}:
+                    keys = [()] * len(chunk)
+                else:
+                    keys = list(zip(*[map(type, column) for column in zip(*chunk)]))
+            else:
+                keys = [tuple(map(type, args)) for args in chunk]
+        else:
+            keys = list(map(type, chunk))
+
+        # Group the elements by the types of the arguments.
+        groups = {}
+        for i, key in enumerate(keys):
+            try:
+                groups[key].append(i)
+            except KeyError:
+                groups[key] = [i]
+
+        results = [None] * len(chunk)
+        for key, indices in groups.items():
+            types = key if star else (key,)
+            first = chunk[indices[0]] if star else (chunk[indices[0]],)
+            method, return_type = self._resolve_method_with_cache(args=first)
+            if self._cache_key(types) in self._cache:
+                _map_group(method, return_type, chunk, indices, star, results)
+            else:
+                # A method which is not faithful might match some of the arguments of
+                # these types, so resolve the method for every element and group the
+                # elements by method.
+                by_method = {}
+                for i in indices:
+                    args = chunk[i] if star else (chunk[i],)
+                    method, return_type = self._resolve_method_with_cache(args=args)
+                    try:
+                        by_method[method][1].append(i)
+                    except KeyError:
+                        by_method[method] = (return_type, [i])
+                for method, (return_type, method_indices) in by_method.items():
+                    _map_group(
+                        method, return_type, chunk, method_indices, star, results
+                    )
+        return results
+
     def invoke(self, *types: TypeHint) -> Callable:
         """Invoke a particular method.
 
@@ -430,10 +1480,14 @@ class Function(metaclass=_FunctionMeta):
 
     def __get__(self, instance, owner):
         if instance is not None:
-            return MethodType(_BoundFunction(self, instance), instance)
+            return _BoundFunction(self, instance)
         else:
             return self
 
+    def __reduce__(self):
+        # Like functions defined with `def`, pickle the function by reference.
+        return self.__qualname__
+
     def __repr__(self) -> str:
         return (
             f"<function {self._f} with {len(self._resolver)} registered and"
@@ -441,32 +1495,382 @@ class Function(metaclass=_FunctionMeta):
         )
 
 
+def _chunks(iterable: Iterable[object], chunksize: int) -> Iterator[List[object]]:
+    """Split an iterable into chunks.
+
+    Args:
+        iterable (iterable[object]): Iterable.
+        chunksize (int): Size of the chunks. The last chunk can be smaller.
+
+    Returns:
+        iterator[list[object]]: Chunks.
+    """
+    if chunksize < 1:
+        raise ValueError(f"Size of chunks must be positive, but is {chunksize}.")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+_pmap_warmed = WeakKeyDictionary()
+"""dict[:class:`.function.Function`, bytes]: For every function, the pickled types of
+arguments with which the function was last warmed by :func:`_pmap_chunk`."""
+
+
+def _pmap_chunk(
+    f: Function, warm: Optional[bytes], chunk: List[object], star: bool
+) -> List[object]:
+    """Call a function for every element of a chunk in a worker of
+    :meth:`Function.pmap`.
+
+    Args:
+        f (:class:`.function.Function`): Function.
+        warm (bytes or None): Pickled types of arguments for which the methods should
+            be resolved first. The methods are only resolved for the first chunk
+            which a worker receives.
+        chunk (list[object]): Arguments or, if `star` is `True`, iterables of
+            arguments.
+        star (bool): Whether the elements of `chunk` are iterables of arguments.
+
+    Returns:
+        list[object]: Results.
+    """
+    if warm is not None and _pmap_warmed.get(f) != warm:
+        f.warm(*pickle.loads(warm))
+        _pmap_warmed[f] = warm
+    return f._map_chunk(chunk, star)
+
+
+def _batch_method(batch: Callable) -> Callable:
+    """Construct a method from a batch implementation. See
+    :meth:`Function.dispatch_batch`.
+
+    Args:
+        batch (function): Batch implementation.
+
+    Returns:
+        function: Method which calls `batch` with lists of length one. The signature
+            of the method is the signature of `batch`.
+    """
+
+    @wraps(batch)
+    def method(*args, **kw_args):
+        return batch(*([arg] for arg in args), **kw_args)[0]
+
+    method._batch_implementation = batch
+    return method
+
+
+def _map_group(
+    method: Callable,
+    return_type: TypeHint,
+    chunk: List[object],
+    indices: List[int],
+    star: bool,
+    results: List[object],
+) -> None:
+    """Call a method for a group of elements of a chunk. See
+    :meth:`Function._map_chunk`.
+
+    Args:
+        method (function): Method.
+        return_type (type or type hint): Return type of `method`.
+        chunk (list[object]): Arguments or, if `star` is `True`, tuples of arguments.
+        indices (list[int]): Indices of the elements of the group in `chunk`.
+        star (bool): Whether the elements of `chunk` are tuples of arguments.
+        results (list[object]): Results. The results of the group are written to
+            `results` at `indices`.
+    """
+    batch = getattr(method, "_batch_implementation", None)
+    if batch is not None and (not star or chunk[indices[0]]):
+        if star:
+            columns = [list(c) for c in zip(*[chunk[i] for i in indices])]
+        else:
+            columns = [[chunk[i] for i in indices]]
+        outputs = batch(*columns)
+        if len(outputs) != len(indices):
+            raise ValueError(
+                f"Batch implementation `{repr_short(batch)}` returned {len(outputs)} "
+                f"result(s) for {len(indices)} argument(s)."
+            )
+        if return_type is Any:
+            for i, output in zip(indices, outputs):
+                results[i] = output
+        else:
+            for i, output in zip(indices, outputs):
+                results[i] = _convert(output, return_type)
+    elif return_type is not Any:
+        for i in indices:
+            args = chunk[i] if star else (chunk[i],)
+            results[i] = _convert(method(*args), return_type)
+    elif star:
+        for i in indices:
+            results[i] = method(*chunk[i])
+    else:
+        for i in indices:
+            results[i] = method(chunk[i])
+
+
+_max_specialised_arity = 8
+"""int: Calls with at most this many arguments are specialised by
+:func:`_generate_call`."""
+
+
+def _generate_call(f: Function, bound: bool = False) -> Callable:
+    """Generate an implementation of :meth:`Function.__call__` which is specialised to
+    the methods registered for a function.
+
+    For every number of arguments that a registered method accepts, the types of the
+    arguments are looked up in the cache directly. Moreover, if no method declares a
+    return type, then the return value is not converted.
+
+    Args:
+        f (:class:`.function.Function`): Function. All pending registrations must
+            already have been resolved.
+        bound (bool, optional): Generate a method which takes in the function as the
+            first argument, rather than a function. Defaults to `False`.
+
+    Returns:
+        function: Implementation of :meth:`Function.__call__` for `f`.
+    """
+    if f._stats is not None and not bound:
+        return _instrumented_call(f, f._stats)
+
+    methods = f._resolver.methods
+    arities = sorted(
+        {
+            len(method.signature.types)
+            for method in methods
+            if len(method.signature.types) <= _max_specialised_arity
+        }
+    )
+    if any(method.return_type is not Any for method in methods):
+        call = "return _convert(method(*args, **kw_args), return_type)"
+    else:
+        call = "return method(*args, **kw_args)"
+    # For a frozen function with methods which are not faithful, directly look up the
+    # outcome of the compiled checks of those methods.
+    partially = (
+        f._frozen
+        and not f._resolver.is_faithful
+        and not isinstance(f._partial_cache, _LRUCache)
+    )
+    miss = "resolve_partially(key, args)" if partially else "resolve(args=args)"
+
+    if bound:
+        lines = ["def call(self, *args, **kw_args):"]
+    else:
+        lines = ["def call(*args, **kw_args):"]
+    lines.append("    __tracebackhide__ = True")
+    if arities:
+        lines.append("    n = len(args)")
+    for n in arities:
+        if f._weak_cache:
+            types = "".join(f"ref(type(args[{i}])), " for i in range(n))
+        else:
+            types = "".join(f"type(args[{i}]), " for i in range(n))
+        if isinstance(f._cache, _LRUCache):
+            # Avoid the overhead of :meth:`_LRUCache.__getitem__`.
+            lookup = [
+                f"            types = ({types})",
+                "            method, return_type = get(types)",
+                "            touch(types)",
+            ]
+        elif partially:
+            lookup = [
+                f"            key = ({types})",
+                "            method, return_type = cache[key]",
+            ]
+        else:
+            lookup = [f"            method, return_type = cache[({types})]"]
+        lines += [
+            f"    if n == {n}:",
+            "        try:",
+            *lookup,
+            "        except KeyError:",
+            f"            method, return_type = {miss}",
+            f"        {call}",
+        ]
+    lines += [
+        "    method, return_type = resolve(args=args)",
+        f"    {call}",
+    ]
+
+    resolve = f._resolve_method_with_cache
+    partial_cache = f._partial_cache
+
+    def resolve_partially(key, args):
+        __tracebackhide__ = True
+        try:
+            _, matchers, results = partial_cache[key]
+            return results[tuple([match(args) for match in matchers])]
+        except KeyError:
+            return resolve(args=args)
+
+    scope = {
+        "cache": f._cache,
+        "get": dict.__getitem__.__get__(f._cache),
+        "touch": getattr(f._cache, "move_to_end", None),
+        "resolve": resolve,
+        "resolve_partially": resolve_partially,
+        "_convert": _convert,
+        "ref": ref,
+    }
+    code = compile("\n".join(lines), f"<call of {f.__qualname__}>", "exec")
+    exec(code, scope)
+    return scope["call"]
+
+
+def _frozen_class(cls: type, call: Callable) -> type:
+    """Construct a subclass of :class:`Function` for a single frozen function, so
+    that calls directly run the implementation generated for that function. See
+    :meth:`Function.freeze`.
+
+    Args:
+        cls (type): :class:`Function` or a subclass.
+        call (function): Implementation of `__call__` generated by
+            :func:`_generate_call` with `bound=True`.
+
+    Returns:
+        type: Subclass of `cls` which implements `__call__` with `call`.
+    """
+    namespace = {
+        "__call__": call,
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "_frozen_call": True,
+    }
+    return type(cls)(cls.__name__, (cls,), namespace)
+
+
+def _instrumented_call(f: Function, stats: FunctionStats) -> Callable:
+    """Generate an implementation of :meth:`Function.__call__` which collects
+    statistics of the calls.
+
+    Args:
+        f (:class:`.function.Function`): Function. All pending registrations must
+            already have been resolved.
+        stats (:class:`.function.FunctionStats`): Statistics to update.
+
+    Returns:
+        function: Implementation of :meth:`Function.__call__` for `f`.
+    """
+    cache = f._cache
+    partial_cache = f._partial_cache
+    resolve = f._resolve_method_with_cache
+
+    def call(*args, **kw_args):
+        __tracebackhide__ = True
+        stats.calls += 1
+        key = f._cache_key(tuple(map(type, args)))
+        if key in cache:
+            stats.hits += 1
+            method, return_type = cache[key]
+        else:
+            if key in partial_cache:
+                stats.partial += 1
+            else:
+                stats.misses += 1
+            start = perf_counter_ns()
+            try:
+                method, return_type = resolve(args=args)
+            except AmbiguousLookupError:
+                stats.ambiguous += 1
+                raise
+            except NotFoundLookupError:
+                stats.not_found += 1
+                raise
+            finally:
+                stats._record(perf_counter_ns() - start)
+        return _convert(method(*args, **kw_args), return_type)
+
+    return call
+
+
 class _BoundFunction:
     """A bound instance of `.function.Function`.
 
+    Since this object is created upon every attribute access, creating it must be
+    cheap. Attributes like `__name__` and `__doc__` are therefore not copied, but
+    looked up in the bound function when they are requested.
+
     Args:
         f (:class:`.function.Function`): Bound function.
         instance (object): Instance to which the function is bound.
     """
 
+    __slots__ = ("_f", "_instance")
+
     def __init__(self, f, instance):
         self._f = f
-        wraps(f._f)(self)  # This will call the setter for `__doc__`.
         self._instance = instance
 
     @property
     def __doc__(self):
         return self._f.__doc__
 
-    @__doc__.setter
-    def __doc__(self, value):
-        # Don't need to do anything here. The docstring will be derived from `self._f`.
-        # We, however, do need to implement this method, because :func:`wraps` calls
-        # it.
-        pass
+    @property
+    def __module__(self):
+        return self._f.__module__
 
-    def __call__(self, _, *args, **kw_args):
-        return self._f(self._instance, *args, **kw_args)
+    @property
+    def __self__(self):
+        """object: Instance to which the function is bound."""
+        return self._instance
+
+    @property
+    def __func__(self):
+        """:class:`.function.Function`: Bound function."""
+        return self._f
+
+    @property
+    def __signature__(self):
+        """:class:`inspect.Signature`: Signature of the bound function without the
+        first parameter, which is bound to the instance."""
+        signature = inspect.signature(self._f)
+        parameters = list(signature.parameters.values())
+        if parameters and parameters[0].kind in {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        }:
+            parameters = parameters[1:]
+        return signature.replace(parameters=parameters)
+
+    def __getattr__(self, name):
+        # Do not expose the wrapped function, because that would include the instance
+        # in the signature.
+        if name == "__wrapped__":
+            raise AttributeError(name)
+        # Attributes like `__name__` and `__qualname__` are taken from the bound
+        # function.
+        return getattr(self._f, name)
+
+    def __call__(self, *args, **kw_args):
+        __tracebackhide__ = True
+        return self._f._call(self._instance, *args, **kw_args)
+
+    def map(self, iterable, stream=False, chunksize=1024):
+        """See :meth:`.Function.map`."""
+        return self.starmap(((x,) for x in iterable), stream, chunksize)
+
+    def starmap(self, iterable, stream=False, chunksize=1024):
+        """See :meth:`.Function.starmap`."""
+        instance = self._instance
+        return self._f.starmap(
+            ((instance, *args) for args in iterable), stream, chunksize
+        )
+
+    def pmap(self, iterable, executor=None, chunksize=1024, star=False):
+        """See :meth:`.Function.pmap`."""
+        instance = self._instance
+        if not star:
+            iterable = ((x,) for x in iterable)
+        return self._f.pmap(
+            ((instance, *args) for args in iterable), executor, chunksize, star=True
+        )
 
     def invoke(self, *types):
         """See :meth:`.Function.invoke`."""
@@ -478,3 +1882,9 @@ class _BoundFunction:
             return method(self._instance, *args, **kw_args)
 
         return wrapped_method
+
+    def __reduce__(self):
+        return getattr, (self._instance, self._f.__name__)
+
+    def __repr__(self) -> str:
+        return f"<bound method {self._f.__qualname__} of {self._instance!r}>"
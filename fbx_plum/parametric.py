@@ -1,11 +1,13 @@
+import copyreg
 from typing import Union
+from weakref import WeakValueDictionary
 
 import beartype.door
 from beartype.roar import BeartypeDoorNonpepException
 
 from .dispatcher import Dispatcher
 from .function import _owner_transfer
-from .type import resolve_type_hint
+from .type import _is_subhint, resolve_type_hint
 from .util import TypeHint, repr_short
 
 __all__ = [
@@ -120,9 +122,7 @@ def _default_le_type_par(
     p_left: Union[TypeHint, object], p_right: Union[TypeHint, object]
 ) -> bool:
     if is_type(p_left) and is_type(p_right):
-        p_left = beartype.door.TypeHint(resolve_type_hint(p_left))
-        p_right = beartype.door.TypeHint(resolve_type_hint(p_right))
-        return p_left <= p_right
+        return _is_subhint(resolve_type_hint(p_left), resolve_type_hint(p_right))
     else:
         return p_left == p_right
 
@@ -229,11 +229,16 @@ def parametric(original_class=None):
         },
     )
 
-    subclasses = {}
+    # Let concrete parametric types be pickled. See :func:`_reduce_parametric_type`.
+    copyreg.pickle(meta, _reduce_parametric_type)
+
+    # Concrete parametric types which are no longer used can be garbage collected.
+    subclasses = WeakValueDictionary()
 
     def __new__(cls, *ps):
         # Only create a new subclass if it doesn't exist already.
-        if ps not in subclasses:
+        subclass = subclasses.get(ps)
+        if subclass is None:
 
             def __new__(cls, *args, **kw_args):
                 return original_class.__new__(cls)
@@ -249,6 +254,7 @@ def parametric(original_class=None):
             subclass._parametric = True
             subclass._concrete = True
             subclass._type_parameter = ps[0] if len(ps) == 1 else ps
+            subclass._type_parameters = ps
             subclass.__module__ = original_class.__module__
 
             # Attempt to correct docstring.
@@ -258,7 +264,7 @@ def parametric(original_class=None):
                 pass
 
             subclasses[ps] = subclass
-        return subclasses[ps]
+        return subclass
 
     def __init_subclass__(cls, **kw_args):
         cls._parametric = False
@@ -301,6 +307,38 @@ def parametric(original_class=None):
     return parametric_class
 
 
+def _reduce_parametric_type(cls):
+    """Reduce a parametric type for pickling. Concrete parametric types are created
+    dynamically, so they cannot be pickled by reference. Instead, they are pickled as
+    the parametric type and the type parameters.
+
+    Args:
+        cls (type): Parametric type.
+
+    Returns:
+        str or tuple: Reduction of `cls`.
+    """
+    if "_type_parameters" in cls.__dict__:
+        return _concrete_parametric_type, (cls.__bases__[0], cls._type_parameters)
+    else:
+        # This is not a concrete parametric type, so pickle it by reference.
+        return cls.__qualname__
+
+
+def _concrete_parametric_type(parametric_class, ps):
+    """Reconstruct a concrete parametric type after unpickling it. See
+    :func:`_reduce_parametric_type`.
+
+    Args:
+        parametric_class (type): Parametric type.
+        ps (tuple): Type parameters. These must already be initialised.
+
+    Returns:
+        type: Concrete parametric type `parametric_class[ps]`.
+    """
+    return parametric_class.__new__(parametric_class, *ps)
+
+
 def is_concrete(t):
     """Check if a type `t` is a concrete instance of a parametric type.
 
@@ -1,10 +1,11 @@
-from beartype.door import TypeHint
+from typing import Any
 
 import fbx_plum.function
 
 from . import _is_bearable
+from . import type as _type
 from .dispatcher import Dispatcher
-from .type import resolve_type_hint
+from .type import _is_subhint, _resolve, is_faithful, resolve_type_hint
 from .util import repr_short
 
 __all__ = [
@@ -29,9 +30,16 @@ def convert(obj, type_to):
     Returns:
         object: `obj` converted to type `type_to`.
     """
-    type_to = resolve_type_hint(type_to)
-    # TODO: Can we implement this without using `type`?!
-    return _convert.invoke(type(obj), type_to)(obj, type_to)
+    if _cache_versions != _versions():
+        _clear_caches()
+    try:
+        # TODO: Can we implement this without using `type`?!
+        converter, type_to = _converters[type(obj), type_to]
+    except (KeyError, TypeError):
+        converter, type_to = _converter(type(obj), type_to)
+    if converter is None:
+        return obj
+    return converter(obj, type_to)
 
 
 # Deliver `convert`.
@@ -46,6 +54,111 @@ def _convert(obj, type_to):
         raise TypeError(f"Cannot convert `{obj}` to `{repr_short(type_to)}`.")
 
 
+_converters = {}
+"""dict: Cache of :func:`convert`. Maps the type of the object and the type to convert
+to to the conversion method, or `None` if no conversion is necessary, and the
+resolution of the type to convert to."""
+
+_promotions = {}
+"""dict: Cache of :func:`promote`. Maps the types of the objects to, for every object,
+the conversion method and the common type, or to `None` if no conversion is
+necessary."""
+
+_cache_versions = None
+"""tuple or None: Versions returned by :func:`_versions` for which :data:`_converters`
+and :data:`_promotions` are valid."""
+
+
+def _versions():
+    """Get the versions on which :data:`_converters` and :data:`_promotions` depend.
+
+    Returns:
+        tuple[int, int, int]: :data:`.type._type_version` and the generations of
+            :func:`_convert` and :func:`_promotion_rule`.
+    """
+    return _type._type_version, _convert._generation, _promotion_rule._generation
+
+
+def _clear_caches():
+    """Clear the caches of :func:`convert` and :func:`promote`."""
+    global _cache_versions
+    _converters.clear()
+    _promotions.clear()
+    _cache_versions = _versions()
+
+
+def _store(cache, key, value):
+    """Store an entry in :data:`_converters` or :data:`_promotions`, if the cache is
+    still valid and the key is hashable.
+
+    Args:
+        cache (dict): Cache.
+        key (tuple): Key.
+        value (object): Value.
+    """
+    # Finding the value might have resolved pending methods, so check that the cache
+    # is still valid.
+    if _cache_versions == _versions():
+        try:
+            if len(cache) >= _type._type_cache_size:
+                cache.clear()
+            cache[key] = value
+        except TypeError:
+            # The key is not hashable.
+            pass
+
+
+def _find_converter(type_from, type_to):
+    """Find the conversion method to convert objects of a particular type to a
+    particular type.
+
+    Args:
+        type_from (type): Type to convert from.
+        type_to (type or type hint): Type to convert to.
+
+    Returns:
+        function or None: Conversion method, which must be called with the object and
+            the resolution of `type_to`. If no conversion is necessary, then this is
+            `None`.
+        type or type hint: Resolution of `type_to`.
+        bool: Whether the result can be cached.
+    """
+    resolution, cacheable = _resolve(type_to)
+    method, return_type = _convert._resolve_method_with_cache(
+        types=(type_from, resolution)
+    )
+    if (
+        method is _convert._f
+        and return_type is Any
+        and is_faithful(resolution)
+        and _is_subhint(type_from, resolution)
+    ):
+        # Only the fallback applies and it will always return the object.
+        converter = None
+    elif return_type is Any:
+        converter = method
+    else:
+        converter = _convert.invoke(type_from, resolution)
+    return converter, resolution, cacheable
+
+
+def _converter(type_from, type_to):
+    """Like :func:`_find_converter`, but cache the result, if possible.
+
+    Args:
+        type_from (type): Type to convert from.
+        type_to (type or type hint): Type to convert to.
+
+    Returns:
+        function or None: Conversion method. See :func:`_find_converter`.
+        type or type hint: Resolution of `type_to`.
+    """
+    converter, resolution, cacheable = _find_converter(type_from, type_to)
+    if cacheable:
+        _store(_converters, (type_from, type_to), (converter, resolution))
+    return converter, resolution
+
+
 def add_conversion_method(type_from, type_to, f):
     """Add a conversion method to convert an object from one type to another.
 
@@ -99,9 +212,9 @@ def _promotion_rule(type1, type2):
     """
     type1 = resolve_type_hint(type1)
     type2 = resolve_type_hint(type2)
-    if TypeHint(type1) <= TypeHint(type2):
+    if _is_subhint(type1, type2):
         return type2
-    elif TypeHint(type2) <= TypeHint(type1):
+    elif _is_subhint(type2, type1):
         return type1
     else:
         raise TypeError(
@@ -143,21 +256,63 @@ def promote(obj1, obj2, *objs):
     # Convert to a single tuple.
     objs = (obj1, obj2) + objs
 
+    if _cache_versions != _versions():
+        _clear_caches()
     # Get the types of the objects.
     # TODO: Can we implement this without calling `type`?!
-    types = [type(obj) for obj in objs]
+    types = tuple(map(type, objs))
+    try:
+        converters = _promotions[types]
+    except KeyError:
+        converters = _promotion(types)
+
+    if converters is None:
+        return objs
+    return tuple(
+        [
+            obj if converter is None else converter(obj, common_type)
+            for obj, (converter, common_type) in zip(objs, converters)
+        ]
+    )
+
+
+def _promotion(types):
+    """Find how to promote objects of particular types to a common type and cache the
+    result, if possible.
+
+    Args:
+        types (tuple[type]): Types of the objects.
+
+    Returns:
+        tuple[tuple[function or None, type or type hint]] or None: For every object,
+            the conversion method and the common type. See :func:`_find_converter`.
+            If no object needs to be converted, then this is `None`.
+    """
 
     def _promote_types(t0, t1):
-        return resolve_type_hint(_promotion_rule.invoke(t0, t1)(t0, t1))
+        return _resolve(_promotion_rule.invoke(t0, t1)(t0, t1))
 
     # Find the common type.
     _promotion_rule._resolve_pending_registrations()
-    common_type = _promote_types(types[0], types[1])
+    common_type, cacheable = _promote_types(types[0], types[1])
     for t in types[2:]:
-        common_type = _promote_types(common_type, t)
+        common_type, common_type_cacheable = _promote_types(common_type, t)
+        cacheable = cacheable and common_type_cacheable
+
+    # Find the conversion methods.
+    converters = []
+    for t in types:
+        converter, resolution, converter_cacheable = _find_converter(t, common_type)
+        converters.append((converter, resolution))
+        cacheable = cacheable and converter_cacheable
+    if all(converter is None for converter, _ in converters):
+        converters = None
+    else:
+        converters = tuple(converters)
 
-    # Convert objects and return.
-    return tuple(convert(obj, common_type) for obj in objs)
+    if cacheable:
+        _store(_promotions, types, converters)
+    return converters
 
 
 @_dispatch
@@ -1,10 +1,25 @@
 import pydoc
 import sys
+import threading
 from functools import wraps
-from typing import Callable, List, Optional, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+from weakref import WeakKeyDictionary
 
 from fbx_plum.method import Method
 from fbx_plum.signature import Signature
+from fbx_plum.type import UnionType, _faithful_supertype, _is_subhint
+
+from . import _is_bearable
 
 __all__ = ["AmbiguousLookupError", "NotFoundLookupError"]
 
@@ -91,17 +106,79 @@ def _document(f: Callable, f_name: Optional[str] = None) -> str:
 class Resolver:
     """Method resolver.
 
+    To quickly find the methods which match arguments, the resolver maintains an index
+    for every argument position which maps the type of an argument to the methods
+    which accept arguments of that type. The index is completed lazily whilst resolving
+    methods.
+
+    Of the matching methods, the most specific ones are found by comparing their
+    signatures. The outcomes of comparisons between signatures are remembered, so
+    every pair of methods is compared at most once, and only if both methods match
+    the same arguments. Registering a method therefore does not compare signatures.
+
+    Once a resolver is used to resolve methods, no methods should be registered. To
+    register methods, register them with a copy, which can then replace the resolver.
+    Resolution is thread safe.
+
     Attributes:
         methods (list[:class:`.method.Method`]): Registered methods.
         is_faithful (bool): Whether all methods are faithful or not.
     """
 
-    __slots__ = ("methods", "is_faithful", "function_name")
+    __slots__ = (
+        "methods",
+        "is_faithful",
+        "function_name",
+        "_signatures",
+        "_order",
+        "_index",
+        "_classes",
+        "_arity",
+        "_unfaithful",
+        "_lock",
+    )
 
     def __init__(self, function_name: Optional[str] = None):
         self.function_name = function_name
         self.methods: List[Method] = []
         self.is_faithful: bool = True
+        # The signatures of the methods. This is used to quickly determine whether
+        # an equal signature has already been registered.
+        self._signatures: Set[Signature] = set()
+
+        # For pairs of indices `(i, j)` of methods, whether the signature of method
+        # `i` is as specific as the signature of method `j`. This is completed lazily.
+        self._order: Dict[Tuple[int, int], bool] = {}
+        # For every argument position, a mapping from types to a bit mask of the
+        # methods for which it is known whether they accept arguments of that type and
+        # a bit mask of the methods which accept arguments of that type. The last
+        # position also covers all positions after it. Methods which are not faithful
+        # are always included and must be checked separately. The types are weakly
+        # referenced, so they can be garbage collected.
+        self._index: Optional[List[WeakKeyDictionary]] = None
+        # For every argument position, a mapping from classes to a bit mask of the
+        # methods which accept exactly the subclasses of one of a number of classes
+        # at that position, and a bit mask of these methods. This is used to fill in
+        # the index for a new type from the classes in its MRO.
+        self._classes: List[Tuple[Dict[type, int], int]] = []
+        # A mapping from numbers of arguments to bit masks of the methods which
+        # accept that many arguments.
+        self._arity: Dict[int, int] = {}
+        # Bit mask of the methods which are not faithful.
+        self._unfaithful: int = 0
+        # Protects the lazy completion of the index.
+        self._lock = threading.RLock()
+
+    def __copy__(self) -> "Resolver":
+        copied = Resolver(function_name=self.function_name)
+        with self._lock:
+            copied.methods = list(self.methods)
+            copied.is_faithful = self.is_faithful
+            copied._signatures = set(self._signatures)
+            # Registering methods does not change the positions of methods, so the
+            # comparisons can be reused.
+            copied._order = dict(self._order)
+        return copied
 
     def doc(self, exclude: Union[Callable, None] = None) -> str:
         """Concatenate the docstrings of all methods of this function. Remove duplicate
@@ -139,23 +216,266 @@ class Resolver:
         """
         signature = method.signature
 
-        existing = [m.signature == signature for m in self.methods]
+        try:
+            exists = signature in self._signatures
+        except TypeError:
+            # The signature is not hashable.
+            exists = True
+        if exists:
+            existing = [m.signature == signature for m in self.methods]
+        else:
+            existing = []
         if any(existing):
             if sum(existing) != 1:
                 raise AssertionError(
                     f"The added method `{method}` is equal to {sum(existing)} "
                     f"existing methods. This should never happen."
                 )
+            # The signature is equal to the existing one, so the comparisons with
+            # other methods do not change.
             self.methods[existing.index(True)] = method
+            # Use a double negation for slightly better performance.
+            self.is_faithful = not any(
+                not m.signature.is_faithful for m in self.methods
+            )
         else:
+            try:
+                self._signatures.add(signature)
+            except TypeError:
+                # The signature is not hashable.
+                pass
             self.methods.append(method)
+            self.is_faithful = self.is_faithful and signature.is_faithful
+            # The index must be rebuilt.
+            self._index = None
+
+    def _le(self, i: int, j: int) -> bool:
+        """Check whether the signature of a method is as specific as the signature of
+        another method.
+
+        Args:
+            i (int): Index of the first method.
+            j (int): Index of the second method.
+
+        Returns:
+            bool: Whether the signature of method `i` is as specific as the signature
+                of method `j`.
+        """
+        # If the comparisons are cleared concurrently, the outcome must not be
+        # recorded in the new comparisons.
+        order = self._order
+        try:
+            return order[i, j]
+        except KeyError:
+            le = self.methods[i].signature <= self.methods[j].signature
+            order[i, j] = le
+            return le
+
+    def _most_specific(self, indices: List[int]) -> List[int]:
+        """Find the most specific methods.
+
+        Args:
+            indices (list[int]): Indices of methods in order of registration.
+
+        Returns:
+            list[int]: Indices of the methods of `indices` for which no other method of
+                `indices` is strictly more specific. If two methods are as specific as
+                each other, then the one registered last is deemed the more specific
+                one.
+        """
+        le = self._le
+        candidates = []
+        for i in indices:
+            # If the method is not comparable to any of the candidates, then add the
+            # method as a new candidate.
+            if not any(le(i, c) or le(c, i) for c in candidates):
+                candidates.append(i)
+                continue
+            # The method is comparable to at least one of the candidates. First,
+            # remove the candidates which are strictly less specific. Signatures of
+            # different methods are never equal.
+            remaining = [c for c in candidates if not le(i, c)]
+            # If the method is as specific as at least one candidate, then and only
+            # then add it as a candidate.
+            if len(remaining) < len(candidates):
+                remaining.append(i)
+            candidates = remaining
+        return candidates
+
+    def unfaithful_candidates(self, types: Tuple[type, ...]) -> List[Method]:
+        """Find the methods which are not faithful and which might match arguments of
+        particular types.
+
+        Args:
+            types (tuple[type]): Types of the arguments.
 
-        # Use a double negation for slightly better performance.
-        self.is_faithful = not any(not s.signature.is_faithful for s in self.methods)
+        Returns:
+            list[:class:`.method.Method`]: Methods which are not faithful and which
+                might match arguments of types `types`.
+        """
+        candidates = []
+        for m in self.methods:
+            signature = m.signature
+            if signature.is_faithful:
+                continue
+            n = len(signature.types)
+            if not (n == len(types) or (n < len(types) and signature.has_varargs)):
+                continue
+            hints = signature.expand_varargs(len(types))
+            if all(
+                _is_subhint(t, _faithful_supertype(hint))
+                for t, hint in zip(types, hints)
+            ):
+                candidates.append(m)
+        return candidates
 
     def __len__(self) -> int:
         return len(self.methods)
 
+    def clear_cache(self) -> None:
+        """Forget which types are accepted by which methods and how the signatures
+        compare. This must be called if types are modified, e.g. if a class is
+        registered with an abstract base class."""
+        with self._lock:
+            self._order = {}
+            # The index is rebuilt upon the next resolution.
+            self._index = None
+
+    def _candidates(self, args: Tuple[object, ...]) -> Tuple[int, List[List[int]]]:
+        """Find the methods which can match arguments by only using the types of the
+        arguments and what is known about these types in the index.
+
+        Args:
+            args (tuple[object]): Arguments.
+
+        Returns:
+            int: Bit mask of the methods which might accept the arguments.
+            list[list[int]]: For every argument, the entry of the index for the type
+                of the argument. An entry consists of a bit mask of the methods for
+                which it is known whether they accept the type and a bit mask of the
+                methods which accept the type.
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    n = max((len(m.signature.types) for m in self.methods), default=0)
+                    unfaithful = 0
+                    for i, m in enumerate(self.methods):
+                        if not m.signature.is_faithful:
+                            unfaithful |= 1 << i
+                    self._arity = {}
+                    self._unfaithful = unfaithful
+                    self._classes = [
+                        self._index_classes(position) for position in range(n + 1)
+                    ]
+                    # Set the index last, because other threads use the index without
+                    # acquiring the lock once it is set.
+                    self._index = [WeakKeyDictionary() for _ in range(n + 1)]
+                index = self._index
+
+        try:
+            mask = self._arity[len(args)]
+        except KeyError:
+            mask = 0
+            for i, m in enumerate(self.methods):
+                n_types = len(m.signature.types)
+                if n_types == len(args) or (
+                    n_types < len(args) and m.signature.has_varargs
+                ):
+                    mask |= 1 << i
+            self._arity[len(args)] = mask
+
+        last = len(index) - 1
+        entries = []
+        for position, arg in enumerate(args):
+            types = index[min(position, last)]
+            try:
+                entry = types[type(arg)]
+            except KeyError:
+                # Methods which are not faithful are always included. For methods
+                # which accept the subclasses of classes, whether they accept the type
+                # follows from the MRO of the type.
+                classes, known = self._classes[min(position, last)]
+                accepted = self._unfaithful
+                for base in type(arg).__mro__:
+                    accepted |= classes.get(base, 0)
+                entry = types[type(arg)] = [self._unfaithful | known, accepted]
+            known, accepted = entry
+            # Only keep methods which accept the type or for which it is not yet known.
+            mask &= accepted | ~known
+            entries.append(entry)
+        return mask, entries
+
+    def _index_classes(self, position: int) -> Tuple[Dict[type, int], int]:
+        """For an argument position, find the faithful methods which accept exactly
+        the subclasses of one of a number of classes.
+
+        Args:
+            position (int): Argument position.
+
+        Returns:
+            dict[type, int]: Mapping from classes to a bit mask of the methods which
+                accept the subclasses of that class.
+            int: Bit mask of the methods.
+        """
+        classes = {}
+        known = 0
+        for i, m in enumerate(self.methods):
+            signature = m.signature
+            if not signature.is_faithful:
+                continue
+            if position < len(signature.types):
+                t = signature.types[position]
+            elif signature.has_varargs:
+                t = signature.varargs
+            else:
+                # The method does not accept an argument at this position.
+                continue
+            bases = _plain_classes(t)
+            if bases is None:
+                continue
+            bit = 1 << i
+            known |= bit
+            for base in bases:
+                classes[base] = classes.get(base, 0) | bit
+        return classes, known
+
+    def _index_method(
+        self,
+        i: int,
+        position: int,
+        arg: object,
+        entry: List[int],
+    ) -> None:
+        """Determine whether a faithful method accepts an argument at a particular
+        position and record the result in the index. The result is valid for all
+        arguments of the same type as `arg`.
+
+        Args:
+            i (int): Index of the method.
+            position (int): Position of the argument.
+            arg (object): Argument.
+            entry (list[int]): Entry of the index for the type of `arg`.
+        """
+        signature = self.methods[i].signature
+        if position < len(signature.types):
+            t = signature.types[position]
+        else:
+            # The check on the number of arguments ensures that there are variable
+            # arguments.
+            t = signature.varargs
+        bit = 1 << i
+        # Since the method is faithful, the check for `arg` holds for all objects of
+        # the same type.
+        accepted = _is_bearable(arg, t)
+        with self._lock:
+            # Other threads might update the entry concurrently. Mark the method as
+            # known only after recording whether it accepts the type.
+            if accepted:
+                entry[1] |= bit
+            entry[0] |= bit
+
     def resolve(self, target: Union[Tuple[object, ...], Signature]) -> Method:
         """Find the most specific signature that satisfies a target.
 
@@ -168,37 +488,29 @@ class Resolver:
                 `target`.
         """
         if isinstance(target, tuple):
-
-            def check(m):
-                # `target` are concrete arguments.
-                return m.signature.match(target)
+            # `target` are concrete arguments. First use the index to find the
+            # methods which can match.
+            mask, entries = self._candidates(target)
+            unfaithful = self._unfaithful
+
+            def check(i):
+                # Complete the index for this method where necessary.
+                bit = 1 << i
+                for position, entry in enumerate(entries):
+                    if not entry[0] & bit:
+                        self._index_method(i, position, target[position], entry)
+                    if not entry[1] & bit:
+                        return False
+                # Methods which are not faithful must be checked against the arguments.
+                return not unfaithful & bit or self.methods[i].signature.match(target)
+
+            matching = [i for i in _bits(mask) if check(i)]
 
         else:
+            # `target` is a signature that must be encompassed.
+            matching = [i for i, m in enumerate(self.methods) if target <= m.signature]
 
-            def check(m):
-                # `target` is a signature that must be encompassed.
-                return target <= m.signature
-
-        candidates = []
-        for method in [m for m in self.methods if check(m)]:
-            # If none of the candidates are comparable, then add the method as
-            # a new candidate and continue.
-            if not any(c.signature.is_comparable(method.signature) for c in candidates):
-                candidates += [method]
-                continue
-
-            # The signature under consideration is comparable with at least one
-            # of the candidates. First, filter any strictly more general candidates.
-            new_candidates = [
-                c for c in candidates if not method.signature < c.signature
-            ]
-
-            # If the signature under consideration is as specific as at least
-            # one candidate, then and only then add it as a candidate.
-            if any(method.signature <= c.signature for c in candidates):
-                candidates = new_candidates + [method]
-            else:
-                candidates = new_candidates
+        candidates = [self.methods[i] for i in self._most_specific(matching)]
 
         if len(candidates) == 0:
             # There is no matching signature.
@@ -223,3 +535,50 @@ class Resolver:
                     f"`{target}` is ambiguous among the following:\n"
                     f"  {listed_candidates}"
                 )
+
+
+def _plain_classes(t: object) -> Optional[Tuple[type, ...]]:
+    """If objects are of type hint `t` if and only if the MRO of their type contains one
+    of a number of classes, then find these classes.
+
+    Args:
+        t (type or type hint): Type hint.
+
+    Returns:
+        tuple[type] or None: The classes, or `None` if there are no such classes.
+    """
+    if get_origin(t) in {Union, UnionType}:
+        bases = ()
+        for arg in get_args(t):
+            arg_bases = _plain_classes(arg)
+            if arg_bases is None:
+                return None
+            bases += arg_bases
+        return bases
+    # The check must not be customised by the metaclass. Parametrised generics like
+    # `list[int]` are not instances of `type`.
+    meta = type(t)
+    if (
+        issubclass(meta, type)
+        and meta.__instancecheck__ is type.__instancecheck__
+        and meta.__subclasscheck__ is type.__subclasscheck__
+    ):
+        return (t,)
+    return None
+
+
+def _bits(mask: int) -> List[int]:
+    """Get the indices of the bits which are set in a bit mask.
+
+    Args:
+        mask (int): Bit mask.
+
+    Returns:
+        list[int]: Indices of the set bits in increasing order.
+    """
+    indices = []
+    while mask:
+        lowest = mask & -mask
+        indices.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return indices
@@ -2,13 +2,24 @@ import inspect
 import operator
 import typing
 from copy import copy
+from types import FunctionType
 from typing import Callable, List, Tuple, Union
+from weakref import WeakKeyDictionary
 
-import beartype.door
+from beartype import BeartypeConf
 from beartype.peps import resolve_pep563 as beartype_resolve_pep563
 
+try:
+    # This is what :func:`beartype.door.is_bearable` uses to construct the checks. It
+    # is private, so :func:`_tester` falls back to :func:`_is_bearable` if it does not
+    # behave as expected.
+    from beartype._check.checkmake import make_func_tester as _make_func_tester
+except ImportError:  # pragma: no cover
+    _make_func_tester = None
+
 from . import _is_bearable
-from .type import is_faithful, resolve_type_hint
+from . import type as _type
+from .type import _is_subhint, is_faithful, resolve_type_hint
 from .util import Comparable, Missing, TypeHint, multihash, repr_short, wrap_lambda
 
 __all__ = ["Signature", "append_default_args"]
@@ -39,7 +50,7 @@ class Signature(Comparable):
     _default_varargs = Missing
     _default_precedence = 0
 
-    __slots__ = ("types", "varargs", "precedence", "is_faithful")
+    __slots__ = ("types", "varargs", "precedence", "_is_faithful", "_type_version")
 
     def __init__(
         self,
@@ -58,10 +69,9 @@ class Signature(Comparable):
         self.types = types
         self.varargs = varargs
         self.precedence = precedence
-
-        types_are_faithful = all(is_faithful(t) for t in types)
-        varargs_are_faithful = self.varargs is Missing or is_faithful(self.varargs)
-        self.is_faithful = types_are_faithful and varargs_are_faithful
+        # Whether the signature is faithful is determined when it is first needed.
+        # Many signatures, e.g. the ones constructed to look up methods, never need it.
+        self._type_version = None
 
     @staticmethod
     def from_callable(f: Callable, precedence: int = 0) -> "Signature":
@@ -85,6 +95,17 @@ class Signature(Comparable):
     def has_varargs(self) -> bool:
         return self.varargs is not Missing
 
+    @property
+    def is_faithful(self) -> bool:
+        # The result depends on the resolution of the types, so recompute it when the
+        # resolution of types has changed.
+        if self._type_version != _type._type_version:
+            types_are_faithful = all(is_faithful(t) for t in self.types)
+            varargs_are_faithful = self.varargs is Missing or is_faithful(self.varargs)
+            self._is_faithful = types_are_faithful and varargs_are_faithful
+            self._type_version = _type._type_version
+        return self._is_faithful
+
     def __copy__(self):
         cls = type(self)
         copy = cls.__new__(cls)
@@ -92,7 +113,9 @@ class Signature(Comparable):
         copy.types = self.types
         copy.varargs = self.varargs
         copy.precedence = self.precedence
-        copy.is_faithful = self.is_faithful
+        copy._type_version = self._type_version
+        if self._type_version is not None:
+            copy._is_faithful = self._is_faithful
         return copy
 
     def __repr__(self) -> str:
@@ -150,10 +173,7 @@ class Signature(Comparable):
         if (
             self.has_varargs
             and other.has_varargs
-            and not (
-                beartype.door.TypeHint(self.varargs)
-                <= beartype.door.TypeHint(other.varargs)
-            )
+            and not _is_subhint(self.varargs, other.varargs)
         ):
             return False
 
@@ -169,12 +189,7 @@ class Signature(Comparable):
         # Finally, expand the types and compare.
         self_types = self.expand_varargs(len(other.types))
         other_types = other.expand_varargs(len(self.types))
-        return all(
-            [
-                beartype.door.TypeHint(x) <= beartype.door.TypeHint(y)
-                for x, y in zip(self_types, other_types)
-            ]
-        )
+        return all(_is_subhint(x, y) for x, y in zip(self_types, other_types))
 
     def match(self, values) -> bool:
         """Check whether values match the signature.
@@ -197,9 +212,85 @@ class Signature(Comparable):
             return all(_is_bearable(v, t) for v, t in zip(values, types))
 
 
+def _tester(hint: TypeHint) -> Callable[[object], bool]:
+    """Construct a function which checks whether an object satisfies a type hint.
+    The function gives the same result as :func:`_is_bearable`, but avoids the
+    overhead of looking up the check for the type hint for every call.
+
+    Args:
+        hint (type or type hint): Type hint.
+
+    Returns:
+        function: Function which takes in an object and returns whether it satisfies
+            `hint`.
+    """
+    if _make_func_tester is not None:
+        try:
+            # Pass the arguments by position, because the result is cached.
+            tester = _make_func_tester(hint, BeartypeConf())
+            # :func:`make_func_tester` is private, so its interface might change.
+            # Check that the function can be called and agrees with
+            # :func:`_is_bearable`.
+            probe = object()
+            if tester(probe) is _is_bearable(probe, hint):
+                return tester
+        except Exception:
+            # Fall back to :func:`_is_bearable`, which produces the error, if any.
+            pass
+    return lambda x: _is_bearable(x, hint)
+
+
+def _compile_match(signature: Signature) -> Callable[[Tuple[object, ...]], bool]:
+    """Compile :meth:`Signature.match` for a signature.
+
+    Args:
+        signature (:class:`.signature.Signature`): Signature.
+
+    Returns:
+        function: Function which takes in a tuple of values and returns the same as
+            `signature.match`.
+    """
+    n = len(signature.types)
+    scope = {f"t{i}": _tester(t) for i, t in enumerate(signature.types)}
+    checks = [f"t{i}(values[{i}])" for i in range(n)]
+    if signature.has_varargs:
+        scope["tv"] = _tester(signature.varargs)
+        condition = f"len(values) >= {n}"
+        checks.append(f"all(map(tv, values[{n}:]))")
+    else:
+        condition = f"len(values) == {n}"
+    source = f"def match(values):\n    return {' and '.join([condition] + checks)}"
+    exec(compile(source, f"<match of {signature}>", "exec"), scope)
+    return scope["match"]
+
+
+_signatures = WeakKeyDictionary()
+"""weakref.WeakKeyDictionary[function, tuple[tuple, inspect.Signature]]: Cache for
+:func:`inspect_signature`. For every function, this contains the attributes of the
+function which determine its signature and the signature."""
+
+
+def _signature_determinants(f: FunctionType) -> tuple:
+    """Get the attributes of a function which determine its signature.
+
+    Args:
+        f (function): Function.
+
+    Returns:
+        tuple: Attributes of `f` which determine its signature.
+    """
+    return (
+        f.__code__,
+        f.__defaults__,
+        f.__kwdefaults__,
+        tuple(f.__annotations__.items()),
+    )
+
+
 def inspect_signature(f) -> inspect.Signature:
     """Wrapper of :func:`inspect.signature` which adds support for certain non-function
-    objects.
+    objects. For functions, the result is cached until the code, default values, or
+    annotations of the function change.
 
     Args:
         f (object): Function-like object.
@@ -211,7 +302,29 @@ def inspect_signature(f) -> inspect.Signature:
         f = wrap_lambda(f)
     elif isinstance(f, operator.attrgetter):
         f = wrap_lambda(f)
-    return inspect.signature(f)
+    # The signature of functions which are wrapped or which set a custom signature
+    # might depend on other objects, so do not cache those.
+    if type(f) is not FunctionType or (
+        "__wrapped__" in f.__dict__ or "__signature__" in f.__dict__
+    ):
+        return inspect.signature(f)
+
+    determinants = _signature_determinants(f)
+    try:
+        cached_determinants, sig = _signatures[f]
+        if cached_determinants == determinants:
+            return sig
+    except KeyError:
+        pass
+    sig = inspect.signature(f)
+    _signatures[f] = determinants, sig
+    return sig
+
+
+_pep563_resolved = WeakKeyDictionary()
+"""weakref.WeakKeyDictionary[function, tuple]: For every function whose annotations
+have been resolved by :func:`resolve_pep563`, the attributes of the function which
+determine its signature right after the resolution."""
 
 
 def resolve_pep563(f: Callable):
@@ -223,11 +336,17 @@ def resolve_pep563(f: Callable):
         f (Callable): Function whose annotations should be resolved.
     """
     if hasattr(f, "__annotations__"):
+        is_function = type(f) is FunctionType
+        if is_function and _pep563_resolved.get(f) == _signature_determinants(f):
+            # The annotations are already resolved.
+            return
         beartype_resolve_pep563(f)  # This mutates `f`.
         # Override the `__annotations__` attribute, since `resolve_pep563` modifies
         # `f` too.
         for k, v in typing.get_type_hints(f).items():
             f.__annotations__[k] = v
+        if is_function:
+            _pep563_resolved[f] = _signature_determinants(f)
 
 
 def _extract_signature(f: Callable, precedence: int = 0) -> Signature:
@@ -327,6 +446,9 @@ def append_default_args(signature: Signature, f: Callable) -> List[Signature]:
 
         # Remove the last positional argument.
         signature_copy.types = signature_copy.types[:-1]
+        # The types changed, so whether the signature is faithful must be determined
+        # again.
+        signature_copy._type_version = None
 
         signatures.append(signature_copy)
 
@@ -2,8 +2,11 @@ import abc
 import sys
 import typing
 import warnings
+from functools import lru_cache
 from typing import Literal, get_args, get_origin
 
+import beartype.door
+
 try:  # pragma: specific no cover 3.8 3.9
     from types import UnionType
 except ImportError:  # pragma: specific no cover 3.10 3.11
@@ -46,6 +49,7 @@ class ResolvableType(type):
             :class:`ResolvableType`: `self`.
         """
         self._type = type
+        _clear_type_caches()
         return self
 
     def resolve(self):
@@ -150,22 +154,205 @@ def _hashable(x):
         return False
 
 
-type_mapping = {}
+class _TypeMapping(dict):
+    """A dictionary which clears all caches that depend on the resolution of types
+    whenever it is modified."""
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        _clear_type_caches()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        _clear_type_caches()
+
+    def clear(self):
+        dict.clear(self)
+        _clear_type_caches()
+
+    def pop(self, *args):
+        value = dict.pop(self, *args)
+        _clear_type_caches()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        _clear_type_caches()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = dict.setdefault(self, key, default)
+        _clear_type_caches()
+        return value
+
+    def update(self, *args, **kw_args):
+        dict.update(self, *args, **kw_args)
+        _clear_type_caches()
+
+
+type_mapping = _TypeMapping()
 """dict: When running :func:`resolve_type_hint`, map keys in this dictionary to the
 values."""
 
 
+def _is_class(x):
+    """Check if an object is a class which is not a type hint from :mod:`typing` or
+    similar modules and which is not a :class:`ResolvableType`.
+
+    Args:
+        x (object): Object to check.
+
+    Returns:
+        bool: `True` if `x` is such a class and `False` otherwise.
+    """
+    return (
+        isinstance(x, type)
+        and not isinstance(x, ResolvableType)
+        and not _is_hint(x)
+        and _hashable(x)
+    )
+
+
+_type_cache_size = 2**14
+"""int: Maximum number of entries of the caches of :func:`resolve_type_hint`,
+:func:`is_faithful`, :func:`_type_hint`, and :func:`_is_subhint`."""
+
+
+@lru_cache(maxsize=_type_cache_size)
+def _type_hint(x):
+    """Construct a :class:`beartype.door.TypeHint` for `x`. The results are cached, so
+    the same object is returned for equal type hints.
+
+    Args:
+        x (type or type hint): Type hint. Must be hashable.
+
+    Returns:
+        :class:`beartype.door.TypeHint`: Type hint for `x`.
+    """
+    return beartype.door.TypeHint(x)
+
+
+@lru_cache(maxsize=_type_cache_size)
+def _is_subhint_cached(x, y):
+    return _type_hint(x) <= _type_hint(y)
+
+
+def _is_subhint(x, y):
+    """Check whether a type hint is a sub-type hint of another type hint. The results
+    are cached.
+
+    Args:
+        x (type or type hint): First type hint.
+        y (type or type hint): Second type hint.
+
+    Returns:
+        bool: Whether `x` is a sub-type hint of `y`.
+    """
+    if (type(x) is type and type(y) is type) or (_is_class(x) and _is_class(y)):
+        # For classes, this is what :mod:`beartype` does. This is cheap, so do not
+        # cache the result. Then the cache also does not keep the classes alive, e.g.
+        # concrete parametric types.
+        return issubclass(x, y)
+    try:
+        return _is_subhint_cached(x, y)
+    except TypeError:
+        # One of the type hints is not hashable. Do not cache the result.
+        return beartype.door.TypeHint(x) <= beartype.door.TypeHint(y)
+
+
+_type_version = 0
+"""int: Version of the resolution of types. This is incremented whenever
+:data:`type_mapping` changes or a :class:`ResolvableType` is delivered, so caches which
+depend on the resolution of types can check whether they are still valid."""
+
+_resolutions = {}
+"""dict: Cache of :func:`resolve_type_hint`. Maps type hints to tuples containing the
+type hint and its resolution."""
+
+_faithfulness = {}
+"""dict: Cache of :func:`is_faithful`. Maps type hints to tuples containing the type
+hint and whether it is faithful."""
+
+
+def _clear_type_caches():
+    """Clear all caches that depend on the resolution of types."""
+    global _type_version
+    _type_version += 1
+    _resolutions.clear()
+    _faithfulness.clear()
+    _type_hint.cache_clear()
+    _is_subhint_cached.cache_clear()
+
+
 def resolve_type_hint(x):
     """Resolve all :class:`ResolvableType` in a type or type hint.
 
+    The resolutions are cached until :data:`type_mapping` changes or a
+    :class:`ResolvableType` is delivered.
+
+    Args:
+        x (type or type hint): Type hint.
+
+    Returns:
+        type or type hint: `x`, but with all :class:`ResolvableType`\\s resolved.
+    """
+    return _resolve(x)[0]
+
+
+def _resolve(x):
+    """Resolve a type or type hint and cache the result, if possible.
+
     Args:
         x (type or type hint): Type hint.
 
     Returns:
         type or type hint: `x`, but with all :class:`ResolvableType`\\s resolved.
+        bool: Whether the resolution can be cached. It cannot be cached if it contains
+            a :class:`ResolvableType` which has not yet been delivered or if `x` could
+            not be resolved.
+    """
+    if (type(x) is type or _is_class(x)) and x not in type_mapping:
+        # This is the common case. It is cheap, so do not cache the result. Then the
+        # cache also does not keep the classes alive, e.g. concrete parametric types.
+        return x, True
+    try:
+        # Equal type hints might not be the same, e.g. `Union[int, str]` and
+        # `Union[str, int]`, so only use the cache if `x` itself was cached.
+        cached_x, resolution = _resolutions[x]
+        if cached_x is x:
+            return resolution, True
+    except (KeyError, TypeError):
+        pass
+    resolution, cacheable = _resolve_uncached(x)
+    if cacheable and _hashable(x):
+        if len(_resolutions) >= _type_cache_size:
+            _resolutions.clear()
+        _resolutions[x] = (x, resolution)
+    return resolution, cacheable
+
+
+def _resolve_all(xs):
+    """Resolve a sequence of types or type hints.
+
+    Args:
+        xs (iterable[type or type hint]): Type hints.
+
+    Returns:
+        list[type or type hint]: Resolutions of `xs`.
+        bool: Whether all resolutions can be cached.
     """
+    resolutions = []
+    cacheable = True
+    for x in xs:
+        resolution, x_cacheable = _resolve(x)
+        resolutions.append(resolution)
+        cacheable = cacheable and x_cacheable
+    return resolutions, cacheable
+
+
+def _resolve_uncached(x):
     if _hashable(x) and x in type_mapping:
-        return resolve_type_hint(type_mapping[x])
+        return _resolve(type_mapping[x])
     elif _is_hint(x):
         origin = get_origin(x)
         args = get_args(x)
@@ -173,51 +360,59 @@ def resolve_type_hint(x):
             # `origin` might not make sense here. For example, `get_origin(Any)` is
             # `None`. Since the hint wasn't subscripted, the right thing is to right the
             # hint itself.
-            return x
+            return x, True
         else:
             if origin is UnionType:  # pragma: specific no cover 3.8 3.9
                 # The new union syntax was used.
                 y = args[0]
                 for arg in args[1:]:
                     y = y | arg
-                return y
+                return y, True
             else:
+                cacheable = True
                 # Do not resolve the arguments for `Literal`s.
                 if origin != Literal:
-                    args = resolve_type_hint(args)
+                    args, cacheable = _resolve(args)
                 try:
-                    return origin[args]
+                    return origin[args], cacheable
                 except TypeError as e:  # pragma: specific no cover 3.9 3.10 3.11
                     # In Python 3.8, the origin might be a type that cannot be
                     # subscripted. As a workaround, we get the name of the type,
                     # capitalize it, and try to get it from `typing`. So far, this
                     # seems to have worked fine.
                     if sys.version_info.minor <= 8:
-                        return getattr(typing, origin.__name__.capitalize())[args]
+                        origin = getattr(typing, origin.__name__.capitalize())
+                        return origin[args], cacheable
                     else:  # pragma: no cover
                         # This branch can never be reached.
                         raise e
 
     elif x is None:
-        return x
+        return x, True
     elif x is Ellipsis:
-        return x
+        return x, True
 
     elif isinstance(x, tuple):
-        return tuple(resolve_type_hint(arg) for arg in x)
+        resolutions, cacheable = _resolve_all(x)
+        return tuple(resolutions), cacheable
     elif isinstance(x, list):
-        return list(resolve_type_hint(arg) for arg in x)
+        return _resolve_all(x)
     elif isinstance(x, type):
         if isinstance(x, ResolvableType):
             if isinstance(x, ModuleType):
                 if not x.retrieve():
                     # If the type could not be retrieved, then just return the
                     # wrapper. Namely, `x.resolve()` will then return `x`, which means
-                    # that the below call will result in an infinite recursion.
-                    return x
-            return resolve_type_hint(x.resolve())
+                    # that the below call will result in an infinite recursion. The
+                    # type might be retrieved later, so do not cache this.
+                    return x, False
+            resolution = x.resolve()
+            if resolution is x:
+                # The type has not yet been delivered.
+                return x, False
+            return _resolve(resolution)
         else:
-            return x
+            return x, True
 
     else:
         warnings.warn(
@@ -225,9 +420,10 @@ def resolve_type_hint(x):
             f"I have ended the resolution here to not make your code break, but some "
             f"types might not be working correctly. "
             f"Please open an issue at https://github.com/wesselb/fbx_plum.",
-            stacklevel=2,
+            stacklevel=4,
         )
-        return x
+        # Do not cache this, so the warning is raised every time.
+        return x, False
 
 
 def is_faithful(x):
@@ -244,13 +440,69 @@ def is_faithful(x):
         class UnfaithfulType:
             __faithful__ = False
 
+    The results are cached until :data:`type_mapping` changes or a
+    :class:`ResolvableType` is delivered.
+
+    Args:
+        x (type or type hint): Type hint.
+
+    Returns:
+        bool: Whether `x` is faithful or not.
+    """
+    return _faithful(x)[0]
+
+
+def _faithful(x):
+    """Check whether a type hint is faithful and cache the result, if possible.
+
     Args:
         x (type or type hint): Type hint.
 
     Returns:
         bool: Whether `x` is faithful or not.
+        bool: Whether the result can be cached. See :func:`_resolve`.
+    """
+    if (type(x) is type or _is_class(x)) and x not in type_mapping:
+        # This is the common case. It is cheap, so do not cache the result. Then the
+        # cache also does not keep the classes alive, e.g. concrete parametric types.
+        return _is_faithful(x)
+    try:
+        cached_x, faithful = _faithfulness[x]
+        if cached_x is x:
+            return faithful, True
+    except (KeyError, TypeError):
+        pass
+    resolution, cacheable = _resolve(x)
+    faithful, faithful_cacheable = _is_faithful(resolution)
+    cacheable = cacheable and faithful_cacheable
+    if cacheable and _hashable(x):
+        if len(_faithfulness) >= _type_cache_size:
+            _faithfulness.clear()
+        _faithfulness[x] = (x, faithful)
+    return faithful, cacheable
+
+
+def _faithful_all(xs):
+    """Check whether all type hints in a sequence are faithful.
+
+    Args:
+        xs (iterable[type or type hint]): Type hints.
+
+    Returns:
+        bool: Whether all type hints in `xs` are faithful.
+        bool: Whether the result can be cached.
     """
-    return _is_faithful(resolve_type_hint(x))
+    all_cacheable = True
+    for x in xs:
+        faithful, cacheable = _faithful(x)
+        all_cacheable = all_cacheable and cacheable
+        if not faithful:
+            return False, all_cacheable
+    return True, all_cacheable
+
+
+_default_instancechecks = {type.__instancecheck__, abc.ABCMeta.__instancecheck__}
+"""set: Implementations of `__instancecheck__` which are faithful."""
 
 
 def _is_faithful(x):
@@ -261,36 +513,139 @@ def _is_faithful(x):
             # Unsubscripted type hints tend to be faithful. For example, `Any`, `List`,
             # `Tuple`, `Dict`, `Callable`, and `Generator` are. When we come across a
             # counter-example, we will refine this logic.
-            return True
+            return True, True
         else:
             if origin in {typing.Union, typing.Optional}:
-                return all(is_faithful(arg) for arg in args)
+                return _faithful_all(args)
             else:
-                return False
+                return False, True
 
     elif x is None:
-        return True
+        return True, True
     elif x == Ellipsis:
-        return True
+        return True, True
 
     elif isinstance(x, (tuple, list)):
-        return all(is_faithful(arg) for arg in x)
+        return _faithful_all(x)
     elif isinstance(x, type):
         if hasattr(x, "__faithful__"):
-            return x.__faithful__
+            return x.__faithful__, True
         else:
             # This is the fallback method. Check whether `__instancecheck__` is default
             # or not. If it is, assume that it is faithful.
-            return type(x).__instancecheck__ in {
-                type.__instancecheck__,
-                abc.ABCMeta.__instancecheck__,
-            }
+            return type(x).__instancecheck__ in _default_instancechecks, True
     else:
         warnings.warn(
             f"Could not determine whether `{x}` is faithful or not. "
             f"I have concluded that the type is not faithful, so your code might run "
             f"with subpar performance. "
             f"Please open an issue at https://github.com/wesselb/fbx_plum.",
-            stacklevel=2,
+            stacklevel=4,
         )
-        return False
+        # Do not cache this, so the warning is raised every time.
+        return False, False
+
+
+def _faithful_supertype(x):
+    """Find a faithful type or type hint which is satisfied by all objects which
+    satisfy a type hint.
+
+    Args:
+        x (type or type hint): Type hint.
+
+    Returns:
+        type or type hint: Faithful type or type hint which is satisfied by all
+            objects which satisfy `x`. If nothing better can be found, this is
+            `object`.
+    """
+    if is_faithful(x):
+        return x
+    elif _is_hint(x):
+        origin = get_origin(x)
+        args = get_args(x)
+        if origin in {typing.Union, UnionType}:
+            supertypes = tuple(_faithful_supertype(arg) for arg in args)
+        elif origin is Literal:
+            supertypes = tuple(type(arg) for arg in args)
+        elif (
+            isinstance(origin, type)
+            and origin.__module__ != "typing"
+            and is_faithful(origin)
+        ):
+            # For example, `tuple` for `tuple[int]` or `Tuple[int]`. Exclude special
+            # forms like `Annotated`.
+            return origin
+        else:
+            return object
+        if object in supertypes:
+            return object
+        return typing.Union[supertypes]
+    else:
+        # For example, a type with a custom `__instancecheck__`. We cannot know which
+        # objects will satisfy the type.
+        return object
+
+
+def _unfaithful_parts(x):
+    """Find the parts of a type hint which make the type hint not faithful.
+
+    Args:
+        x (type or type hint): Type hint.
+
+    Returns:
+        list[type or type hint]: Parts of `x` which are not faithful. If `x` is
+            faithful, then this is empty.
+    """
+    x = resolve_type_hint(x)
+    if is_faithful(x):
+        return []
+    if _is_hint(x) and get_origin(x) in {typing.Union, UnionType}:
+        parts = [part for arg in get_args(x) for part in _unfaithful_parts(arg)]
+        if parts:
+            return parts
+    return [x]
+
+
+def _faithful_suggestion(x):
+    """Suggest how to make a part of a type hint faithful.
+
+    Args:
+        x (type or type hint): Part of a type hint which is not faithful. See
+            :func:`_unfaithful_parts`.
+
+    Returns:
+        str or None: Suggestion or `None` if there is no suggestion.
+    """
+    if isinstance(x, type) and not hasattr(x, "__faithful__"):
+        name = x.__name__
+        return (
+            f"`{name}` has a custom `__instancecheck__`. If `isinstance(x, {name})` "
+            f"is equivalent to `issubclass(type(x), {name})` for all `x`, then set "
+            f"`{name}.__faithful__ = True`."
+        )
+    return None
+
+
+def _referenced_types(x):
+    """Find all types which occur in a type hint.
+
+    Args:
+        x (type or type hint): Type hint.
+
+    Returns:
+        set[type]: All types which occur in `x`, including `x` itself if `x` is a
+            type.
+    """
+    types = set()
+    if _is_hint(x):
+        origin = get_origin(x)
+        if isinstance(origin, type):
+            types.add(origin)
+        for arg in get_args(x):
+            types |= _referenced_types(arg)
+    elif isinstance(x, (tuple, list)):
+        for arg in x:
+            types |= _referenced_types(arg)
+    elif isinstance(x, type):
+        types.add(x)
+    return types
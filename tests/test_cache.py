@@ -1,6 +1,23 @@
-from typing import List, Union
-
-from fbx_plum import Dispatcher, Function, clear_all_cache
+import abc
+import gc
+import sys
+import weakref
+from numbers import Number
+from types import SimpleNamespace
+from typing import Any, List, Literal, Tuple, Union
+
+import pytest
+
+from fbx_plum import (
+    Dispatcher,
+    Function,
+    ModuleType,
+    NotFoundLookupError,
+    Signature,
+    clear_all_cache,
+    clear_cache_for,
+    parametric,
+)
 
 from .util import benchmark
 
@@ -165,6 +182,163 @@ def test_cache_clearing():
     assert len(f._resolver) == 2
 
 
+def test_cache_clearing_order():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "first"
+
+    assert f(1) == "first"
+
+    @dispatch
+    def f(x: int):
+        return "second"
+
+    # Clearing the cache before the second method is registered should not change
+    # which method is registered last.
+    f.clear_cache()
+    assert f(1) == "second"
+
+
+def test_cache_clearing_abc():
+    dispatch = Dispatcher()
+
+    class Base(metaclass=abc.ABCMeta):  # noqa: B024
+        pass
+
+    class My:
+        pass
+
+    @dispatch
+    def f(x: object):
+        return "object"
+
+    @dispatch
+    def f(x: Base):
+        return "Base"
+
+    assert f(My()) == "object"
+
+    # Registering `My` with `Base` changes which methods accept `My`. Clearing the
+    # cache should also clear what the resolver knows about `My`.
+    Base.register(My)
+    f.clear_cache(reregister=False)
+    assert f(My()) == "Base"
+
+
+def test_cache_clearing_partial():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: Literal[1]):
+        return "one"
+
+    assert f(1) == "one"
+    key = f._cache_key((int,))
+    assert key in f._partial_cache
+
+    # If the caches are cleared by another thread after the entry was found, the
+    # method should be resolved without the entry.
+    f._partial_cache.clear()
+    method, _ = f._resolve_method_partially(key, (2,))
+    assert method(2) == "int"
+
+
+def test_cache_clearing_for_types(monkeypatch):
+    dispatch = Dispatcher()
+
+    class A:
+        pass
+
+    class B:
+        pass
+
+    @dispatch
+    def f(x: A):
+        return "A"
+
+    @dispatch
+    def f(x: List[A], y: int):
+        return "list"
+
+    @dispatch
+    def g(x: object):
+        return "object"
+
+    @dispatch
+    def h(x: int):
+        return "int"
+
+    assert f(A()) == "A"
+    assert f([A()], 1) == "list"
+    for x in [A(), B()]:
+        assert g(x) == "object"
+    assert h(1) == "int"
+
+    clear_cache_for(A)
+
+    # `f` mentions `A`, so the methods of `f` must be registered again.
+    assert len(f._cache) == 0
+    assert len(f._resolver) == 0
+    assert len(f._pending) == 2
+    assert f(A()) == "A"
+    # `g` does not mention `A`, so only the entry for `A` must be removed.
+    assert set(g._cache) == {(B,)}
+    assert len(g._resolver) == 1
+    # `h` does not depend on `A` at all.
+    assert set(h._cache) == {(int,)}
+
+    # Test the use case of a type which is retrieved from a module later.
+    T = ModuleType("tests.later_module", "LaterType")
+
+    @dispatch
+    def m(x: T):
+        return "T"
+
+    with pytest.raises(NotFoundLookupError):
+        m(LaterType())
+    # Pretend that the module of `T` has been loaded.
+    module = SimpleNamespace(LaterType=LaterType)
+    monkeypatch.setitem(sys.modules, "tests.later_module", module)
+    clear_cache_for(T)
+    assert m(LaterType()) == "T"
+
+
+class LaterType:
+    pass
+
+
+def test_cache_clearing_for_abc():
+    dispatch = Dispatcher()
+
+    class Base(metaclass=abc.ABCMeta):  # noqa: B024
+        pass
+
+    class My:
+        pass
+
+    @dispatch
+    def f(x: object):
+        return "object"
+
+    @dispatch
+    def f(x: Base):
+        return "Base"
+
+    assert f(My()) == "object"
+
+    # Clearing the cache for `My` should also clear what the resolver knows about
+    # `My`.
+    Base.register(My)
+    clear_cache_for(My)
+    assert f(My()) == "Base"
+
+
 def test_cache_unfaithful():
     dispatch = Dispatcher()
 
@@ -176,7 +350,169 @@ def test_cache_unfaithful():
     def f(x: List[int]):
         return 2
 
-    # Since `f` is not faithful, no cache should be accumulated.
+    # Although `f` is not faithful, an `int` can never match `List[int]`, so `f(1)`
+    # can be cached. `f([1])` cannot.
     assert f(1) == 1
     assert f([1]) == 2
+    assert len(f._cache) == 1
+    assert (int,) in f._cache
+    assert len(f._partial_cache) == 1
+    assert (list,) in f._partial_cache
+
+    # Check that the partial cache correctly distinguishes by value.
+    assert f(1) == 1
+    assert f([1]) == 2
+    with pytest.raises(NotFoundLookupError):
+        f(["1"])
+    assert f([2]) == 2
+
+    # Clearing the cache should also clear the partial cache.
+    f.clear_cache()
+    assert len(f._cache) == 0
+    assert len(f._partial_cache) == 0
+
+
+def test_cache_partially_unfaithful():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int, y: int):
+        return "int"
+
+    @dispatch
+    def f(x: Number, y: Tuple[int]):
+        return "tuple[int]"
+
+    @dispatch
+    def f(x: object, y: tuple):
+        return "tuple"
+
+    @dispatch
+    def f(x: int, y: Literal[1, 2]):
+        return "literal"
+
+    assert f(1, 3) == "int"
+    assert f(1, 1) == "literal"
+    assert f(1, 2) == "literal"
+    assert f(1, (1,)) == "tuple[int]"
+    assert f(1, ("1",)) == "tuple"
+    assert f("1", (1,)) == "tuple"
+
+    # The first argument of the last call cannot match `Number`, so this call can be
+    # cached.
+    assert (str, tuple) in f._cache
+    candidates, _, results = f._partial_cache[(int, int)]
+    assert [m.signature for m in candidates] == [Signature(int, Literal[1, 2])]
+    assert results == {
+        (False,): (f._resolver.methods[0].implementation, Any),
+        (True,): (f._resolver.methods[3].implementation, Any),
+    }
+    candidates, _, results = f._partial_cache[(int, tuple)]
+    assert candidates == [f._resolver.methods[1]]
+    assert len(results) == 2
+
+
+def test_cache_bounded():
+    dispatch = Dispatcher(cache_size=2)
+
+    @dispatch
+    def f(x: Number):
+        return "number"
+
+    @dispatch
+    def f(x: Number, y: Number):
+        return "numbers"
+
+    class A:
+        @dispatch
+        def f(self, x: int):
+            return "int"
+
+    assert f.cache_size == 2
+    assert f.cache_info() == (0, 0, 2, 0)
+
+    assert f(1) == "number"
+    assert f(1.0) == "number"
+    assert f.cache_info() == (2, 0, 2, 0)
+    # Use `(int,)`, so `(float,)` is the least recently used entry.
+    assert f(1) == "number"
+    assert f(1j) == "number"
+    assert set(f._cache) == {(int,), (complex,)}
+    assert f.cache_info() == (2, 0, 2, 1)
+    # Also test the path of the generic call.
+    assert f(1, 1.0) == "numbers"
+    assert set(f._cache) == {(complex,), (int, float)}
+    assert f.cache_info().evictions == 2
+
+    # Set the size through the dispatcher.
+    assert A().f(1) == "int"
+    dispatch.cache_size = None
+    assert f.cache_size is None
+    assert A.f.cache_size is None
+    assert f.cache_info() == (0, 0, None, 0)
+    for x in [1, 1.0, 1j]:
+        assert f(x) == "number"
+    assert A().f(1) == "int"
+    assert dispatch.cache_info() == {
+        "test_cache_bounded.<locals>.f": (3, 0, None, 0),
+        "test_cache_bounded.<locals>.A.f": (1, 0, None, 0),
+    }
+
+    with pytest.raises(ValueError):
+        f.cache_size = 0
+
+
+def test_cache_weak():
+    dispatch = Dispatcher(weak_cache=True)
+
+    @dispatch
+    def f(x: object):
+        return "object"
+
+    @dispatch
+    def f(x: object, y: Literal[1]):
+        return "literal"
+
+    assert f.weak_cache
+
+    class A:
+        pass
+
+    a_ref = weakref.ref(A)
+    for _ in range(2):
+        assert f(A()) == "object"
+        assert f(A(), 1) == "literal"
+        assert f.invoke(A)(None) == "object"
+    assert f(1) == "object"
+    assert len(f._cache) == 2
+    assert len(f._partial_cache) == 1
+
+    # If `A` is garbage collected, all entries for `A` must be removed.
+    del A
+    gc.collect()
+    assert a_ref() is None
+    assert len(f._cache) == 1
+    assert len(f._partial_cache) == 0
+    assert f(1) == "object"
+
+    # Turning off weak caching clears the cache.
+    dispatch.weak_cache = False
+    assert not f.weak_cache
     assert len(f._cache) == 0
+    assert f(1) == "object"
+    assert (int,) in f._cache
+
+
+def test_registries_weak():
+    @parametric
+    class A:
+        pass
+
+    # Concrete parametric types and functions must be garbage collected.
+    a_ref = weakref.ref(A[int])
+    f_ref = weakref.ref(Function(lambda x: x))
+    n = len(Function._instances)
+    gc.collect()
+    assert a_ref() is None
+    assert f_ref() is None
+    assert len(Function._instances) < n
@@ -1,5 +1,11 @@
+import json
+import pickle
+import sys
+import threading
+
 import pytest
 
+import fbx_plum.dispatcher
 from fbx_plum import Dispatcher
 from fbx_plum.signature import Signature as Sig
 
@@ -61,6 +67,66 @@ def test_dispatch_multi():
         dispatch.multi(1)
 
 
+def test_varargs_most_specific():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: object, *xs: object):
+        return "object"
+
+    @dispatch
+    def f(*xs: int):
+        return "int"
+
+    assert f() == "int"
+    assert f(1) == "int"
+    assert f(1, "a") == "object"
+
+
+def test_threads():
+    dispatch = Dispatcher()
+    n_threads, n = 8, 10
+    barrier = threading.Barrier(n_threads)
+    errors = []
+
+    def register(t):
+        barrier.wait()
+        try:
+            for i in range(n):
+                arity = t * n + i + 1
+
+                def f(*xs, arity=arity):
+                    return arity
+
+                # Methods of different arities do not override each other.
+                g = dispatch.multi((int,) * arity)(f)
+                assert g(*(1,) * arity) == arity
+                if i % 5 == 0:
+                    g.clear_cache()
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    # Switch between threads as often as possible to provoke races.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [
+            threading.Thread(target=register, args=(t,)) for t in range(n_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    f = dispatch.functions["f"]
+    assert len(f.methods) == n_threads * n
+    for arity in range(1, n_threads * n + 1):
+        assert f(*(1,) * arity) == arity
+
+
 def test_abstract():
     dispatch = Dispatcher()
 
@@ -70,3 +136,211 @@ def test_abstract():
 
     assert f.__doc__ == "Docs"
     assert f.methods == []
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_warm(background):
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    class A:
+        @dispatch
+        def g(self, x: str):
+            return "str"
+
+    report = dispatch.warm({"f": [(int,), (str,)], A.g: [(A, str)]}, background)
+    if background:
+        report = report.result()
+    assert report == {
+        "test_warm.<locals>.f": ([(int,)], [], [(str,)]),
+        "test_warm.<locals>.A.g": ([(A, str)], [], []),
+    }
+    assert set(f._cache) == {(int,)}
+    assert set(A.g._cache) == {(A, str)}
+
+
+def test_stats():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    assert dispatch.stats() == {}
+    with dispatch.collect_stats() as stats:
+        f(1)
+
+        class A:
+            @dispatch
+            def g(self):
+                return "g"
+
+        A().g()
+    assert set(stats) == {"test_stats.<locals>.f", "test_stats.<locals>.A.g"}
+    assert stats["test_stats.<locals>.f"].calls == 1
+    assert stats["test_stats.<locals>.A.g"].calls == 1
+    assert dispatch.stats() == {}
+
+    dispatch.enable_stats()
+
+    @dispatch
+    def h(x: int):
+        return "int"
+
+    f(1)
+    h(1)
+    assert {name: s.calls for name, s in dispatch.stats().items()} == {
+        "test_stats.<locals>.f": 1,
+        "test_stats.<locals>.A.g": 0,
+        "test_stats.<locals>.h": 1,
+    }
+    dispatch.disable_stats()
+    assert dispatch.stats() == {}
+
+
+def test_freeze_all():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    class A:
+        @dispatch
+        def g(self):
+            return "g"
+
+    dispatch.freeze_all()
+    assert f.frozen and A.g.frozen
+    assert f(1) == "int"
+    assert A().g() == "g"
+    dispatch.unfreeze_all()
+    assert not f.frozen and not A.g.frozen
+
+
+pickled_dispatch = Dispatcher(cache_size=8)
+
+
+@pickled_dispatch
+def pickled(x: int):
+    return "int"
+
+
+def test_pickle():
+    dispatch = pickle.loads(pickle.dumps(Dispatcher(cache_size=8)))
+    assert dispatch.cache_size == 8
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    assert f(1) == "int"
+
+    # The functions are pickled by reference.
+    dispatch = pickle.loads(pickle.dumps(pickled_dispatch))
+    assert dispatch.functions == {"pickled": pickled}
+    assert dispatch.functions["pickled"](1) == "int"
+
+    @dispatch
+    def g(x: int):
+        return "int"
+
+    assert g(1) == "int"
+    assert g.cache_size == 8
+
+
+class SnapshotType:
+    pass
+
+
+def _snapshot_dispatcher(bool_method=False):
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: SnapshotType, y: float = 1.0):
+        return "type"
+
+    @dispatch
+    def f(x: object):
+        return "object"
+
+    if bool_method:
+        # For example, another module registers a method.
+
+        @dispatch
+        def f(x: bool):
+            return "bool"
+
+    class A:
+        @dispatch
+        def g(self):
+            return "g"
+
+    return dispatch, f, A
+
+
+def test_snapshot(tmp_path):
+    path = str(tmp_path / "cache.json")
+
+    dispatch, f, A = _snapshot_dispatcher()
+    assert f(1) == "int"
+    assert f(True) == "int"
+    assert f(SnapshotType()) == "type"
+    assert f(SnapshotType(), 1.0) == "type"
+    # `A` cannot be found by its qualified name, so this will not be saved.
+    assert f(A()) == "object"
+    dispatch.save_cache(path, version="1")
+
+    dispatch, f, A = _snapshot_dispatcher()
+    # The version must match.
+    assert dispatch.load_cache(path) == 0
+    assert dispatch.load_cache(path, version="2") == 0
+    assert len(f._cache) == 0
+    assert dispatch.load_cache(path, version="1") == 4
+    assert set(f._cache) == {(int,), (bool,), (SnapshotType,), (SnapshotType, float)}
+    assert f(1) == "int"
+    assert f(SnapshotType(), 1.0) == "type"
+    assert f(A()) == "object"
+    assert A().g() == "g"
+
+    # If methods have been added, the entries for the function should not be loaded.
+    dispatch, f, _ = _snapshot_dispatcher(bool_method=True)
+    assert dispatch.load_cache(path, version="1") == 0
+    assert len(f._cache) == 0
+    assert f(True) == "bool"
+
+    # If a module has been modified, nothing should be loaded.
+    with open(path) as file:
+        snapshot = json.load(file)
+    snapshot["modules"][__name__] += 1
+    with open(path, "w") as file:
+        json.dump(snapshot, file)
+    dispatch, f, _ = _snapshot_dispatcher()
+    assert dispatch.load_cache(path, version="1") == 0
+    assert len(f._cache) == 0
+
+    # Invalid files should be ignored.
+    assert dispatch.load_cache(str(tmp_path / "missing.json")) == 0
+
+
+def test_snapshot_concurrent_calls(tmp_path, monkeypatch):
+    dispatch, f, _ = _snapshot_dispatcher()
+    assert f(1) == "int"
+
+    # Simulate calls in other threads which add entries to the cache whilst the
+    # cache is saved.
+    find = fbx_plum.dispatcher._find
+
+    def find_and_call(*args):
+        assert f(type("Local", (), {})()) == "object"
+        return find(*args)
+
+    monkeypatch.setattr(fbx_plum.dispatcher, "_find", find_and_call)
+    dispatch.save_cache(str(tmp_path / "cache.json"))
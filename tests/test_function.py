@@ -1,12 +1,22 @@
 import abc
+import inspect
 import os
+import pickle
 import textwrap
 import typing
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
 
 from fbx_plum import Dispatcher
-from fbx_plum.function import Function, _convert, _owner_transfer
+from fbx_plum.function import (
+    Function,
+    UnfaithfulWarning,
+    _convert,
+    _owner_transfer,
+    _pmap_chunk,
+)
 from fbx_plum.method import Method
 from fbx_plum.resolver import (
     AmbiguousLookupError,
@@ -554,6 +564,452 @@ def test_call_convert():
     assert f(1) == (1,)
 
 
+def test_call_specialisation():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: int, y: int, *z: int):
+        return "ints"
+
+    assert f(1) == "int"
+    assert f(1, 2) == "ints"
+    assert f(1, 2, 3) == "ints"
+    assert f._call.__code__.co_filename == f"<call of {f.__qualname__}>"
+    # The return value is not converted if no method declares a return type.
+    assert "_convert" not in f._call.__code__.co_names
+    assert set(f._cache) == {(int,), (int, int), (int, int, int)}
+
+    # Registering a method must invalidate the specialised call.
+    @dispatch
+    def f(x: str) -> tuple:
+        return x
+
+    assert f._call.__func__ is Function._call_pending
+    assert f("1") == ("1",)
+    assert "_convert" in f._call.__code__.co_names
+    assert f(1) == "int"
+
+    # Calls without a matching method must still raise the right exception.
+    with pytest.raises(NotFoundLookupError):
+        f()
+    with pytest.raises(NotFoundLookupError):
+        f(1.0)
+
+    # Clearing the cache and reregistering must also invalidate the specialised call.
+    f.clear_cache()
+    assert f._call.__func__ is Function._call_pending
+    assert f(1) == "int"
+
+
+def test_warm():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int, y: typing.Union[int, float]):
+        return "int"
+
+    @dispatch
+    def f(x: typing.Union[int, float], y: int):
+        return "int"
+
+    @dispatch
+    def f(x: typing.Literal[1], y: str):
+        return "literal"
+
+    report = f.warm((int, float), (float, int), (int, int), (str, str), (int, str))
+    assert report.resolved == [(int, float), (float, int)]
+    assert report.ambiguous == [(int, int)]
+    assert report.not_found == [(str, str), (int, str)]
+    # `(int, str)` might match a method which is not faithful, so it cannot be cached
+    # from the types only.
+    assert set(f._cache) == {(int, float), (float, int)}
+    assert f(1, 1.0) == "int"
+    assert f(1, "1") == "literal"
+
+
+def test_map():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int) -> tuple:
+        return x
+
+    @dispatch
+    def f(x: str):
+        return "str"
+
+    @dispatch
+    def f(x: typing.Literal["1"]):
+        return "literal"
+
+    @dispatch
+    def f(x: int, y: int):
+        return x + y
+
+    xs = [1, "a", 2, "1", "b"]
+    expected = [(1,), "str", (2,), "literal", "str"]
+    assert f.map(xs) == expected
+    assert f.starmap([(x,) for x in xs]) == expected
+    assert f.starmap([[1], (1, 2), iter(["1"])]) == [(1,), 3, "literal"]
+    assert f.map([]) == []
+
+    # Test streaming.
+    stream = f.map(iter(xs), stream=True, chunksize=2)
+    assert not isinstance(stream, list)
+    assert list(stream) == expected
+    assert list(f.starmap([(1, 2)] * 3, stream=True)) == [3] * 3
+    with pytest.raises(ValueError):
+        list(f.map(xs, stream=True, chunksize=0))
+
+    with pytest.raises(NotFoundLookupError):
+        f.map([1, 1.0])
+
+    class A:
+        @dispatch
+        def g(self, x: int):
+            return x + 1
+
+    assert A().g.map([1, 2]) == [2, 3]
+    assert list(A().g.starmap([(1,), (2,)], stream=True)) == [2, 3]
+
+
+def test_dispatch_batch():
+    dispatch = Dispatcher()
+    batches = []
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @f.dispatch_batch
+    def f(x: float) -> tuple:
+        batches.append(list(x))
+        return [2 * xi for xi in x]
+
+    @f.dispatch_batch
+    def f(x: str, y: typing.Union[str, typing.Literal[1]]):
+        batches.append((list(x), list(y)))
+        return [xi + str(yi) for xi, yi in zip(x, y)]
+
+    assert f.map([1.0, 1, 2.0]) == [(2.0,), "int", (4.0,)]
+    assert batches == [[1.0, 2.0]]
+
+    # Other calls should call the batch implementation with lists of length one.
+    batches.clear()
+    assert f(1.0) == (2.0,)
+    assert f("a", "b") == "ab"
+    assert batches == [[1.0], (["a"], ["b"])]
+
+    # The method is resolved for every element, because the method is not faithful,
+    # but the elements are still processed as a batch.
+    batches.clear()
+    assert f.starmap([("a", "b"), ("c", 1), ("d", "e")]) == ["ab", "c1", "de"]
+    assert batches == [(["a", "d"], ["b", "e"]), (["c"], [1])]
+
+    @f.dispatch_batch
+    def f(x: bool):
+        return []
+
+    with pytest.raises(ValueError, match="returned 0 result"):
+        f.map([True])
+
+
+def test_cacheability():
+    dispatch = Dispatcher()
+
+    class UnfaithfulMeta(type):
+        def __instancecheck__(self, x):
+            return True
+
+    class Unfaithful(metaclass=UnfaithfulMeta):
+        pass
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    assert f.cacheability() == (True, [])
+
+    @dispatch
+    def f(x: int, y: typing.Union[int, typing.Literal["1"]]):
+        return "literal"
+
+    @dispatch
+    def f(x: Unfaithful):
+        return "unfaithful"
+
+    report = f.cacheability()
+    assert not report.cacheable
+    by_part = {h.part: h for h in report.unfaithful}
+    assert set(by_part) == {typing.Literal["1"], Unfaithful}
+    assert by_part[Unfaithful].signature == Signature(Unfaithful)
+    assert by_part[typing.Literal["1"]].hint == typing.Union[int, typing.Literal["1"]]
+    assert by_part[typing.Literal["1"]].suggestion is None
+    assert by_part[Unfaithful].hint is Unfaithful
+    assert "`Unfaithful.__faithful__ = True`" in by_part[Unfaithful].suggestion
+
+    # If the type explicitly declares that it is not faithful, no suggestion is made.
+    Unfaithful.__faithful__ = False
+    f.clear_cache()
+    by_part = {h.part: h for h in f.cacheability().unfaithful}
+    assert by_part[Unfaithful].suggestion is None
+
+
+def test_warn_unfaithful():
+    dispatch = Dispatcher(warn_unfaithful=True)
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: typing.Literal[1]):
+        return "literal"
+
+    with pytest.warns(UnfaithfulWarning, match=r"`typing.Literal\[1\]`") as record:
+        assert f(1) == "literal"
+    assert len(record) == 1
+    assert record[0].filename == __file__
+
+    # Clearing the cache registers the methods again, which should not warn again.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        f.clear_cache()
+        assert f(1) == "literal"
+
+
+def test_warn_unfaithful_default_args():
+    dispatch = Dispatcher(warn_unfaithful=True)
+
+    @dispatch
+    def f(x: int, y: typing.Literal[1] = 1):
+        return "int"
+
+    # The signature without the default argument is faithful, so calls with one
+    # argument should be cached.
+    with pytest.warns(UnfaithfulWarning):
+        assert f(1) == "int"
+    assert [m.signature.is_faithful for m in f.methods] == [False, True]
+    assert f._cache_key((int,)) in f._cache
+
+
+def test_freeze():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: typing.Literal["1"]):
+        return "literal"
+
+    @dispatch
+    def f(x: str, *xs: typing.Literal[1]):
+        return "varargs"
+
+    @dispatch
+    def f(x: float) -> tuple:
+        return x
+
+    assert not f.frozen
+    assert f.freeze() is f
+    assert f.frozen
+    assert isinstance(f, Function)
+    assert "__call__" in type(f).__dict__
+    for _ in range(2):
+        assert f(1) == "int"
+        assert f("1") == "literal"
+        assert f("2", 1, 1) == "varargs"
+        assert f(1.0) == (1.0,)
+        with pytest.raises(NotFoundLookupError):
+            f("2", 2)
+    # The checks of the methods which are not faithful are compiled.
+    candidates, matchers, _ = f._partial_cache[(str,)]
+    assert [m.signature for m in candidates] == [
+        Signature(typing.Literal["1"]),
+        Signature(str, varargs=typing.Literal[1]),
+    ]
+    assert all(m is not c.signature.match for m, c in zip(matchers, candidates))
+
+    # Registering is not possible.
+    with pytest.raises(RuntimeError, match="(?i)function `.*f` is frozen"):
+
+        @dispatch
+        def f(x: bytes):
+            return "bytes"
+
+    # Clearing the cache or collecting statistics keeps the function frozen.
+    f.clear_cache()
+    with f.collect_stats() as stats:
+        assert f("1") == "literal"
+    assert stats.calls == 1
+    assert f.frozen
+    assert f("1") == "literal"
+    assert "__call__" in type(f).__dict__
+
+    # After unfreezing, registering is possible again.
+    f.unfreeze()
+    assert not f.frozen
+    assert type(f) is Function
+
+    @dispatch
+    def f(x: bytes):
+        return "bytes"
+
+    assert f(b"1") == "bytes"
+    assert f("1") == "literal"
+
+
+def test_freeze_method():
+    dispatch = Dispatcher()
+
+    class A:
+        @dispatch
+        def f(self, x: int):
+            return "int"
+
+        @dispatch
+        def f(self, x: typing.Literal["1"]):
+            return "literal"
+
+    A.f.freeze()
+    assert A().f(1) == "int"
+    assert A().f("1") == "literal"
+    assert A.f(A(), 1) == "int"
+
+
+def test_stats():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: typing.Literal["1"]):
+        return "literal"
+
+    @dispatch
+    def f(x: typing.Union[int, float], y: int):
+        return "union"
+
+    @dispatch
+    def f(x: int, y: typing.Union[int, float]):
+        return "union"
+
+    assert f.stats() is None
+
+    f.enable_stats()
+    assert f(1) == "int"
+    assert f(1) == "int"
+    assert f("1") == "literal"
+    assert f("1") == "literal"
+    with pytest.raises(NotFoundLookupError):
+        f(1.0)
+    with pytest.raises(AmbiguousLookupError):
+        f(1, 1)
+    stats = f.stats()
+    assert (stats.calls, stats.hits, stats.partial, stats.misses) == (6, 1, 1, 4)
+    assert (stats.not_found, stats.ambiguous, stats.mro_fallbacks) == (1, 1, 0)
+    assert stats.hit_rate == 1 / 6
+    assert sum(stats.resolution_times.values()) == 5
+    assert stats.resolution_time > 0
+    assert "calls=6" in repr(stats)
+
+    # Collecting statistics within a context restores the previous statistics.
+    with f.collect_stats() as context_stats:
+        assert f(1) == "int"
+    assert (context_stats.calls, context_stats.hits) == (1, 1)
+    assert f.stats() is stats
+    assert f(1) == "int"
+    assert stats.calls == 7
+
+    # Disabling statistics restores the uninstrumented implementation of calls.
+    f.disable_stats()
+    assert f.stats() is None
+    assert f(1) == "int"
+    assert f._call.__code__.co_filename == f"<call of {f.__qualname__}>"
+
+
+def test_stats_mro_fallback():
+    c = C()
+    c.do.clear_cache()
+    with C.do.collect_stats() as stats:
+        assert c.do(1) == "C"
+        assert c.do(1.0) == "B"
+        assert c.do(1.0) == "B"
+    assert (stats.calls, stats.hits, stats.misses, stats.mro_fallbacks) == (3, 1, 2, 1)
+
+
+@dispatch
+def pickled(x: int):
+    return "int"
+
+
+def test_pickle():
+    # Functions should be pickled by reference.
+    assert pickle.loads(pickle.dumps(pickled)) is pickled
+    assert pickle.loads(pickle.dumps(C.do)) is C.do
+    bound = pickle.loads(pickle.dumps(C().do))
+    assert bound.__func__ is C.do
+    assert bound(1) == "C"
+
+
+def test_pmap():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    @dispatch
+    def f(x: str, y: str):
+        return x + y
+
+    xs = [1, 2, 3, 4, 5]
+    with ThreadPoolExecutor(2) as executor:
+        assert f.pmap(xs, executor, chunksize=2) == ["int"] * 5
+        assert f.pmap([("a", "b")] * 3, executor, star=True) == ["ab"] * 3
+        assert C().do.pmap([1, 2], executor) == ["C", "C"]
+        with pytest.raises(ValueError):
+            f.pmap(xs, executor, chunksize=0)
+
+    # Functions which can be pickled can be run in other processes.
+    pickled(1)
+    with ProcessPoolExecutor(2) as executor:
+        assert pickled.pmap(xs, executor, chunksize=2) == ["int"] * 5
+
+
+def test_pmap_warm():
+    dispatch = Dispatcher()
+
+    @dispatch
+    def f(x: int):
+        return "int"
+
+    # Locally defined types cannot be pickled, so these are omitted.
+    local = type("Local", (), {})
+    assert f._pickled_cache_types() is None
+    f(1)
+    f.warm((local,))
+    warm = f._pickled_cache_types()
+    assert pickle.loads(warm) == [(int,)]
+
+    # Warm the function in a "worker".
+    f.clear_cache(reregister=False)
+    assert _pmap_chunk(f, warm, [], star=False) == []
+    assert f.cache_info().size == 1
+    # A worker should warm the function only once.
+    f.clear_cache(reregister=False)
+    _pmap_chunk(f, warm, [], star=False)
+    assert f.cache_info().size == 0
+
+
 def test_invoke():
     dispatch = Dispatcher()
 
@@ -613,3 +1069,31 @@ def test_bound():
     # Also test that `invoke` is wrapped, like above.
     assert A().do.invoke(int).__doc__ == "Docs"
     assert A.do.invoke(A, int).__doc__ == "Docs"
+
+
+def test_bound_attributes():
+    dispatch = Dispatcher()
+
+    class A:
+        @dispatch
+        def do(self, x: int):
+            """Docs"""
+            return self
+
+    a = A()
+    bound = a.do
+
+    assert bound.__self__ is a
+    assert bound.__func__ is A.do
+    assert bound.__name__ == "do"
+    assert bound.__qualname__ == "test_bound_attributes.<locals>.A.do"
+    assert bound.__module__ == "tests.test_function"
+    assert bound.__doc__ == "Docs"
+    assert repr(bound).startswith("<bound method test_bound_attributes.<locals>.A.do")
+
+    # The instance should be passed to the function.
+    assert bound(1) is a
+
+    # Like for bound methods, the instance should not be part of the signature.
+    assert str(inspect.signature(bound)) == "(x: int)"
+    assert not hasattr(bound, "__wrapped__")
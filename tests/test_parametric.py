@@ -1,4 +1,5 @@
 import abc
+import pickle
 from numbers import Number
 from typing import Optional, Tuple, Union
 
@@ -283,6 +284,18 @@ class NTuple:
         return n, t
 
 
+def test_pickle():
+    t = NTuple[2, int]
+    assert pickle.loads(pickle.dumps(t)) is t
+    assert pickle.loads(pickle.dumps(NTuple)) is NTuple
+    x = pickle.loads(pickle.dumps(NTuple(1, 2)))
+    assert type(x) is t
+    assert x.args == (1, 2)
+
+    assert pickle.loads(pickle.dumps(Val[(1, 2)])) is Val[(1, 2)]
+    assert pickle.loads(pickle.dumps(Val[3]())) == Val[3]()
+
+
 def test_parametric_override_infer_type_parameter():
     # Check type parameter inference.
     assert isinstance(NTuple(1, 2, 3), NTuple[3, int])
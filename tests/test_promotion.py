@@ -5,7 +5,7 @@ import pytest
 
 import fbx_plum
 from fbx_plum import add_conversion_method, add_promotion_rule, conversion_method
-from fbx_plum.promotion import _promotion_rule
+from fbx_plum.promotion import _converters, _promotion_rule, _promotions
 
 
 class Num:
@@ -78,6 +78,26 @@ def test_default_conversion_methods():
     assert fbx_plum.convert("test".encode(), str) == "test"
 
 
+def test_convert_cache(convert):
+    r = Re()
+    assert convert(r, Num) is r
+    # No conversion is necessary, so the conversion should be skipped.
+    assert _converters[Re, Num] == (None, Num)
+    assert convert(r, Union[Num, int]) is r
+
+    # Registering a conversion method should invalidate the cache.
+    add_conversion_method(Re, Num, lambda x: "Num from Re")
+    assert convert(r, Num) == "Num from Re"
+    assert convert(r, Union[Num, int]) is r
+    add_conversion_method(Re, Num, lambda x: "new Num from Re")
+    assert convert(r, Num) == "new Num from Re"
+
+    # Failed conversions should fail every time.
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            convert(1.0, int)
+
+
 def test_promote(convert, promote):
     assert promote() == ()
     assert promote(1) == (1,)
@@ -131,6 +151,28 @@ def test_promote(convert, promote):
     assert promote("1", 1.0, "1") == ("lel", 1.0, "lel")
 
 
+def test_promote_cache(convert, promote):
+    assert promote(1, 1) == (1, 1)
+    # No conversion is necessary.
+    assert _promotions[int, int] is None
+
+    add_promotion_rule(int, float, float)
+    add_conversion_method(int, float, lambda x: x + 1.0)
+    assert promote(1, 1.0, 1) == (2.0, 1.0, 2.0)
+    converters = _promotions[int, float, int]
+    assert [common_type for _, common_type in converters] == [float] * 3
+    assert converters[1][0] is None
+
+    # Adding a promotion rule should invalidate the cache.
+    add_promotion_rule(int, float, Union[int, float])
+    assert promote(1, 1.0, 1) == (1, 1.0, 1)
+
+    # Adding a conversion method should invalidate the cache.
+    add_promotion_rule(int, float, float)
+    add_conversion_method(int, float, lambda x: x + 2.0)
+    assert promote(1, 1.0, 1) == (3.0, 1.0, 3.0)
+
+
 def test_promote_resolve_type_hints(convert, promote):
     t = _promotion_rule(
         fbx_plum.ModuleType("builtins", "int"),
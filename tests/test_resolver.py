@@ -1,3 +1,5 @@
+import copy
+import numbers
 import sys
 import textwrap
 import typing
@@ -6,7 +8,13 @@ import pytest
 
 import fbx_plum.resolver
 from fbx_plum.method import Method
-from fbx_plum.resolver import AmbiguousLookupError, NotFoundLookupError, Resolver, _document
+from fbx_plum.resolver import (
+    AmbiguousLookupError,
+    NotFoundLookupError,
+    Resolver,
+    _bits,
+    _document,
+)
 from fbx_plum.signature import Signature
 
 
@@ -229,3 +237,174 @@ def test_resolve():
     assert r.resolve(m_c1.signature) == m_b1
     m_b2.signature.precedence = 2
     assert r.resolve(m_c1.signature) == m_b2
+
+
+def test_partial_order():
+    class A:
+        pass
+
+    class B(A):
+        pass
+
+    class C(B):
+        pass
+
+    class Unrelated:
+        pass
+
+    def f(x):
+        return x
+
+    m_c = Method(f, Signature(C))
+    m_a = Method(f, Signature(A))
+    m_u = Method(f, Signature(Unrelated))
+    m_b = Method(f, Signature(B))
+
+    r = Resolver()
+    for m in [m_c, m_a, m_u, m_b]:
+        r.register(m)
+
+    # Registering methods should not compare signatures.
+    assert r._order == {}
+
+    # Only the matching methods should be compared.
+    assert r._most_specific([0, 1, 3]) == [0]
+    assert r.resolve((C(),)) == m_c
+    assert r.resolve((Unrelated(),)) == m_u
+    assert all(2 not in pair for pair in r._order)
+
+    # Replacing a method should not change the comparisons.
+    order = dict(r._order)
+    r.register(Method(f, Signature(B)))
+    assert r._order == order
+    assert r.resolve((B(),)).signature == Signature(B)
+
+
+def test_varargs_most_specific():
+    def f(*xs):
+        return xs
+
+    m_object = Method(f, Signature(object, varargs=object))
+    m_int = Method(f, Signature(varargs=int))
+
+    r = Resolver()
+    r.register(m_object)
+    r.register(m_int)
+
+    # `m_int` is more specific than `m_object`, but only `m_int` matches no
+    # arguments.
+    assert r.resolve(()) == m_int
+    assert r.resolve((1,)) == m_int
+    assert r.resolve((1, "a")) == m_object
+
+
+def test_partial_order_equivalent_signatures():
+    def f(x):
+        return x
+
+    # These signatures are equal in specificity. The one registered last should win.
+    m1 = Method(f, Signature(int))
+    m2 = Method(f, Signature(typing.Union[int, bool]))
+
+    r = Resolver()
+    r.register(m1)
+    r.register(m2)
+    assert r.resolve((1,)) == m2
+
+
+def test_index():
+    def f(*xs):
+        return xs
+
+    m_int = Method(f, Signature(int))
+    m_str = Method(f, Signature(str))
+    m_tuple = Method(f, Signature(typing.Tuple[int]))
+    m_varargs = Method(f, Signature(int, varargs=str))
+
+    r = Resolver()
+    for m in [m_int, m_str, m_tuple, m_varargs]:
+        r.register(m)
+
+    assert r.resolve((1,)) == m_int
+    assert r.resolve(((1,),)) == m_tuple
+    with pytest.raises(NotFoundLookupError):
+        r.resolve(((1.0,),))
+    assert r.resolve((1, "1", "2")) == m_varargs
+    with pytest.raises(NotFoundLookupError):
+        r.resolve((1, "1", 2))
+
+    # Check that the index has been populated. The last position covers the variable
+    # arguments.
+    assert len(r._index) == 2
+    known, accepted = r._index[0][int]
+    assert _bits(known & accepted) == [0, 2, 3]
+    assert _bits(r._index[1][str][1]) == [2, 3]
+    assert _bits(r._index[1][int][1]) == [2]
+
+    # Methods which are not faithful are always included.
+    assert r._unfaithful == 1 << 2
+
+    # Once known, the index should be used rather than the types.
+    r._index[0][int][1] = 0
+    with pytest.raises(NotFoundLookupError):
+        r.resolve((1,))
+
+    # Registering a new method should reset the index.
+    r.register(Method(f, Signature(float)))
+    assert r._index is None
+    assert r.resolve((1,)) == m_int
+
+
+def test_index_mro():
+    class A:
+        pass
+
+    class B(A):
+        pass
+
+    def f(x):
+        return x
+
+    m_a = Method(f, Signature(A))
+    m_int_str = Method(f, Signature(typing.Union[int, str]))
+    m_number = Method(f, Signature(numbers.Number))
+    m_literal = Method(f, Signature(typing.Literal[1]))
+
+    r = Resolver()
+    for m in [m_a, m_int_str, m_number, m_literal]:
+        r.register(m)
+
+    # For a new type, the methods which accept the subclasses of classes should be
+    # known from the MRO of the type. The others must still be checked.
+    r._candidates((B(),))
+    r._candidates(("a",))
+    known, accepted = r._index[0][B]
+    assert _bits(known) == [0, 1, 3]
+    assert _bits(accepted) == [0, 3]
+    known, accepted = r._index[0][str]
+    assert _bits(accepted) == [1, 3]
+
+    assert r.resolve((B(),)) == m_a
+    assert r.resolve(("a",)) == m_int_str
+    assert r.resolve((1.0,)) == m_number
+
+
+def test_copy():
+    def f(x):
+        return x
+
+    m_int = Method(f, Signature(int))
+    m_number = Method(f, Signature(numbers.Number))
+
+    r = Resolver(function_name="f")
+    r.register(m_number)
+    assert r.resolve((1,)) == m_number
+
+    # Registering with a copy should not modify the original.
+    r_copy = copy.copy(r)
+    r_copy.register(m_int)
+    assert r_copy.function_name == "f"
+    assert r_copy.methods == [m_number, m_int]
+    assert r_copy.resolve((1,)) == m_int
+    assert r.methods == [m_number]
+    assert r.resolve((1,)) == m_number
@@ -1,13 +1,15 @@
 import inspect
 import operator
+from functools import wraps
 from numbers import Number as Num
 from numbers import Real as Re
-from typing import Any, Tuple
+from typing import Any, Literal, Tuple
 
 import pytest
 
+import fbx_plum.signature
 from fbx_plum.signature import Signature as Sig
-from fbx_plum.signature import append_default_args, inspect_signature
+from fbx_plum.signature import _compile_match, append_default_args, inspect_signature
 from fbx_plum.util import Missing
 
 
@@ -41,6 +43,24 @@ def test_instantiation_copy():
     assert not Sig(int, int, varargs=Tuple[int]).is_faithful
 
 
+def test_is_faithful_type_mapping():
+    from fbx_plum.type import type_mapping
+
+    s = Sig(int)
+    assert s.is_faithful
+    # Copies should not have to recompute whether the signature is faithful.
+    assert s.__copy__()._type_version == s._type_version
+
+    # Whether the signature is faithful should be recomputed when the resolution of
+    # types changes.
+    try:
+        type_mapping[int] = Literal[1]
+        assert not s.is_faithful
+    finally:
+        del type_mapping[int]
+    assert s.is_faithful
+
+
 def _impl(x, y, *z):
     return str(x)
 
@@ -148,6 +168,48 @@ def test_match():
     assert not Sig(int, varargs=int).match(())
 
 
+@pytest.mark.parametrize(
+    "sig",
+    [
+        Sig(),
+        Sig(int),
+        Sig(int, Literal[1]),
+        Sig(int, varargs=Literal["a"]),
+        Sig(varargs=Tuple[int]),
+    ],
+)
+def test_compile_match(sig):
+    match = _compile_match(sig)
+    for values in [(), (1,), (1, 1), (1, 2), (1, "a"), (1, "a", "b"), ((1,), (2,))]:
+        assert match(values) == sig.match(values)
+
+
+def _changed_signature(hint):
+    raise AssertionError("Unexpected call.")
+
+
+def _changed_tester(hint, conf):
+    return lambda obj, conf: True
+
+
+def _wrong_tester(hint, conf):
+    return lambda obj: "yes"
+
+
+@pytest.mark.parametrize(
+    "make_func_tester",
+    [None, _changed_signature, _changed_tester, _wrong_tester],
+)
+def test_compile_match_fallback(monkeypatch, make_func_tester):
+    # If the private function of :mod:`beartype` is missing or changed, the checks
+    # should fall back to :func:`_is_bearable`.
+    monkeypatch.setattr(fbx_plum.signature, "_make_func_tester", make_func_tester)
+    sig = Sig(int, varargs=Literal["a"])
+    match = _compile_match(sig)
+    for values in [(), (1,), (1.0,), (1, "a"), (1, "b")]:
+        assert match(values) == sig.match(values)
+
+
 def test_inspect_signature():
     assert isinstance(inspect_signature(lambda x: x), inspect.Signature)
     assert len(inspect_signature(lambda x: x).parameters) == 1
@@ -155,6 +217,36 @@ def test_inspect_signature():
     assert len(inspect_signature(operator.attrgetter("x")).parameters) == 1
 
 
+def test_inspect_signature_cache():
+    def f(x: int, y=1):
+        pass
+
+    # The signature of functions should be cached.
+    sig = inspect_signature(f)
+    assert inspect_signature(f) is sig
+
+    # If anything that determines the signature changes, the cache should be
+    # invalidated.
+    f.__defaults__ = (2,)
+    assert inspect_signature(f) is not sig
+    assert inspect_signature(f).parameters["y"].default == 2
+    f.__annotations__["x"] = float
+    assert inspect_signature(f).parameters["x"].annotation is float
+
+    def g(x: str):
+        pass
+
+    f.__code__ = g.__code__
+    assert list(inspect_signature(f).parameters) == ["x"]
+
+    # Wrapped functions should not be cached.
+    @wraps(f)
+    def wrapped(*args):
+        pass
+
+    assert inspect_signature(wrapped) is not inspect_signature(wrapped)
+
+
 def assert_signature(f, *types, varargs=Missing):
     sig = Sig.from_callable(f)
     assert sig.types == types
@@ -1,6 +1,9 @@
 import abc
+import gc
 import sys
 import typing
+import weakref
+from typing import get_args
 
 try:
     from typing import Literal
@@ -18,11 +21,18 @@ except ImportError:
 
 import pytest
 
+from fbx_plum import Dispatcher, parametric
 from fbx_plum.type import (
     ModuleType,
     PromisedType,
     ResolvableType,
+    _faithful_supertype,
+    _faithfulness,
     _is_hint,
+    _is_subhint,
+    _is_subhint_cached,
+    _resolutions,
+    _type_hint,
     is_faithful,
     resolve_type_hint,
     type_mapping,
@@ -102,6 +112,48 @@ def test_type_mapping():
         del type_mapping[int]
 
 
+def test_is_subhint():
+    _is_subhint_cached.cache_clear()
+
+    assert _is_subhint(bool, int)
+    assert not _is_subhint(int, bool)
+    assert _is_subhint(int, typing.Union[int, str])
+    assert not _is_subhint(typing.Union[int, str], int)
+    assert _is_subhint(typing.Tuple[int], typing.Tuple[object])
+    assert _is_subhint(int, typing.Any)
+
+    # Repeated checks should hit the cache.
+    misses = _is_subhint_cached.cache_info().misses
+    assert _is_subhint(int, typing.Union[int, str])
+    assert _is_subhint_cached.cache_info().misses == misses
+
+    # Interned type hints should be reused.
+    assert _type_hint(typing.Tuple[int]) is _type_hint(typing.Tuple[int])
+
+    # Unhashable type hints should still work.
+    assert _is_subhint(typing.Literal[[1]], typing.Any)
+
+
+def test_is_subhint_cache_clearing():
+    import fbx_plum
+
+    assert _is_subhint(int, typing.Union[int, str])
+    assert _is_subhint_cached.cache_info().currsize > 0
+
+    # Modifying `type_mapping` should clear the cache.
+    try:
+        type_mapping[int] = float
+        assert _is_subhint_cached.cache_info().currsize == 0
+    finally:
+        del type_mapping[int]
+
+    # Clearing all caches should also clear the cache.
+    assert _is_subhint(int, typing.Union[int, str])
+    assert _is_subhint_cached.cache_info().currsize > 0
+    fbx_plum.clear_all_cache()
+    assert _is_subhint_cached.cache_info().currsize == 0
+
+
 @pytest.mark.parametrize(
     "pseudo_int",
     [
@@ -162,6 +214,45 @@ def test_resolve_type_hint_new_union():
     assert resolve_type_hint(float | int) == float | int
 
 
+def test_resolve_type_hint_cache():
+    import fbx_plum.type
+
+    hint = typing.Tuple[int, typing.Union[int, str]]
+    resolution = resolve_type_hint(hint)
+    assert _resolutions[hint] == (hint, resolution)
+    # Repeated resolutions should hit the cache.
+    assert resolve_type_hint(hint) is resolution
+
+    # Equal type hints which are not the same should not use the cache.
+    assert typing.Union[str, int] == typing.Union[int, str]
+    assert get_args(resolve_type_hint(typing.Union[str, int])) == (str, int)
+
+    # Modifying `type_mapping` should invalidate the cache.
+    version = fbx_plum.type._type_version
+    try:
+        type_mapping[int] = float
+        assert fbx_plum.type._type_version > version
+        resolution = resolve_type_hint(hint)
+        assert get_args(resolution) == (float, typing.Union[float, str])
+    finally:
+        del type_mapping[int]
+    assert get_args(resolve_type_hint(hint)) == (int, typing.Union[int, str])
+
+    # Type hints with undelivered types should not be cached.
+    t = PromisedType("int")
+    assert resolve_type_hint(t) is t
+    assert get_args(resolve_type_hint(typing.Tuple[t])) == (t,)
+    assert typing.Tuple[t] not in _resolutions
+
+    # Delivering a type should invalidate the cache.
+    version = fbx_plum.type._type_version
+    t.deliver(int)
+    assert fbx_plum.type._type_version > version
+    assert get_args(resolve_type_hint(typing.Tuple[t])) == (int,)
+    t.deliver(float)
+    assert get_args(resolve_type_hint(typing.Tuple[t])) == (float,)
+
+
 def test_is_faithful():
     # Example of a not faithful type.
     t_nf = Callable[[int], int]
@@ -214,6 +305,84 @@ def test_is_faithful_abcmeta():
     assert is_faithful(A)
 
 
+def test_is_faithful_cache():
+    hint = typing.Union[int, typing.Tuple[int]]
+    assert not is_faithful(hint)
+    assert _faithfulness[hint] == (hint, False)
+
+    # Modifying `type_mapping` should invalidate the cache.
+    try:
+        type_mapping[typing.Tuple[int]] = str
+        assert is_faithful(hint)
+    finally:
+        del type_mapping[typing.Tuple[int]]
+    assert not is_faithful(hint)
+
+    # Type hints which cannot be resolved should not be cached, so the warning is
+    # raised every time.
+    a = object()
+    for _ in range(2):
+        with pytest.warns(Warning, match=r"(?i)could not (resolve|determine)"):
+            assert not is_faithful((int, a))
+
+
+def test_is_subhint_classes_not_cached():
+    dispatch = Dispatcher(weak_cache=True)
+
+    @parametric
+    class P:
+        pass
+
+    @dispatch
+    def f(x: Literal[1]):
+        return "literal"
+
+    @dispatch
+    def f(x: object):
+        return "object"
+
+    _is_subhint_cached.cache_clear()
+    refs = []
+    for i in range(5):
+        x = P[i]()
+        assert f(x) == "object"
+        refs.append(weakref.ref(type(x)))
+    assert _is_subhint(P[int], P[object])
+
+    # Checks between classes should not keep the classes alive.
+    assert _is_subhint_cached.cache_info().currsize == 0
+    del x
+    gc.collect()
+    assert all(r() is None for r in refs)
+
+
+def test_classes_not_cached():
+    @parametric
+    class P:
+        pass
+
+    class A(metaclass=abc.ABCMeta):  # noqa: B024
+        pass
+
+    refs = []
+    for i in range(5):
+        t = P[i]
+        assert resolve_type_hint(t) is t
+        is_faithful(t)
+        assert t not in _resolutions
+        assert t not in _faithfulness
+        refs.append(weakref.ref(t))
+    assert resolve_type_hint(A) is A
+    assert is_faithful(A)
+    assert A not in _resolutions
+    assert A not in _faithfulness
+
+    # The caches should not keep the classes alive.
+    del t
+    gc.collect()
+    assert all(r() is None for r in refs)
+
+
 def test_is_faithful_dunder():
     """Check that `__faithful__` works."""
 
@@ -239,3 +408,20 @@ def test_is_faithful_literal(recwarn):
     assert not is_faithful(Literal[1])
     # There should be no warnings.
     assert len(recwarn) == 0
+
+
+def test_faithful_supertype():
+    class UnfaithfulType:
+        __faithful__ = False
+
+    assert _faithful_supertype(int) is int
+    assert _faithful_supertype(typing.Union[int, str]) == typing.Union[int, str]
+    assert _faithful_supertype(typing.Tuple[int]) is tuple
+    assert _faithful_supertype(typing.List[int]) is list
+    assert _faithful_supertype(Literal[1, "1"]) == typing.Union[int, str]
+    assert (
+        _faithful_supertype(typing.Union[int, typing.List[int]])
+        == typing.Union[int, list]
+    )
+    assert _faithful_supertype(UnfaithfulType) is object
+    assert _faithful_supertype(typing.Union[int, UnfaithfulType]) is object